@@ -31,7 +31,7 @@ CLEAN_TARGETS += $(ARK_EVALUATOR_SERVICE_DIR)/ark_sdk-*.whl
 CLEAN_TARGETS += $(ARK_EVALUATOR_SERVICE_DIR)/pyproject.toml.bak
 
 # Define phony targets
-.PHONY: $(ARK_EVALUATOR_SERVICE_NAME)-build $(ARK_EVALUATOR_SERVICE_NAME)-install $(ARK_EVALUATOR_SERVICE_NAME)-uninstall $(ARK_EVALUATOR_SERVICE_NAME)-dev $(ARK_EVALUATOR_SERVICE_NAME)-test
+.PHONY: $(ARK_EVALUATOR_SERVICE_NAME)-build $(ARK_EVALUATOR_SERVICE_NAME)-install $(ARK_EVALUATOR_SERVICE_NAME)-uninstall $(ARK_EVALUATOR_SERVICE_NAME)-dev $(ARK_EVALUATOR_SERVICE_NAME)-test $(ARK_EVALUATOR_SERVICE_NAME)-test-ragas $(ARK_EVALUATOR_SERVICE_NAME)-test-providers-ff
 
 # Dependencies
 $(ARK_EVALUATOR_SERVICE_NAME)-deps: $(ARK_EVALUATOR_STAMP_DEPS)
@@ -50,9 +50,19 @@ $(ARK_EVALUATOR_STAMP_DEPS): $(ARK_EVALUATOR_SERVICE_DIR)/pyproject.toml $(ARK_S
 # Test target
 $(ARK_EVALUATOR_SERVICE_NAME)-test: $(ARK_EVALUATOR_STAMP_TEST) # HELP: Run tests for evaluator service
 $(ARK_EVALUATOR_STAMP_TEST): $(ARK_EVALUATOR_STAMP_DEPS)
-	cd $(ARK_EVALUATOR_SERVICE_DIR) && uv run python -m pytest tests/
+	cd $(ARK_EVALUATOR_SERVICE_DIR) && uv run python -m pytest tests/ -n auto --dist loadfile
 	@touch $@
 
+# RAGAS test subset without plugin autoload or the pytest cache
+$(ARK_EVALUATOR_SERVICE_NAME)-test-ragas: $(ARK_EVALUATOR_STAMP_DEPS) # HELP: Run RAGAS provider tests for evaluator service
+	cd $(ARK_EVALUATOR_SERVICE_DIR) && PYTEST_DISABLE_PLUGIN_AUTOLOAD=1 uv run python -m pytest \
+		-p no:cacheprovider -p pytest_asyncio.plugin -p xdist.plugin \
+		tests/oss_providers/ragas -n auto --dist loadfile
+
+# Provider tests, rerunning last failures first from the pytest cache
+$(ARK_EVALUATOR_SERVICE_NAME)-test-providers-ff: $(ARK_EVALUATOR_STAMP_DEPS) # HELP: Rerun failing provider tests for evaluator service
+	cd $(ARK_EVALUATOR_SERVICE_DIR) && uv run python -m pytest --lf --nf tests/providers/
+
 # Build target
 $(ARK_EVALUATOR_SERVICE_NAME)-build: $(ARK_EVALUATOR_STAMP_BUILD) # HELP: Build evaluator service Docker image
 $(ARK_EVALUATOR_STAMP_BUILD): $(ARK_EVALUATOR_STAMP_DEPS)
@@ -1,5 +1,13 @@
 from .interface import OSSEvaluationProvider
-from .manager import EvaluationManager
 from .config import PlatformConfiguration
 
-__all__ = ["OSSEvaluationProvider", "EvaluationManager", "PlatformConfiguration"]
\ No newline at end of file
+__all__ = ["OSSEvaluationProvider", "EvaluationManager", "PlatformConfiguration"]
+
+
+def __getattr__(name):
+    # The manager pulls in every provider (FastAPI, Kubernetes, LLM clients), so it is
+    # only imported when requested; OSS providers importing the interface stay light
+    if name == "EvaluationManager":
+        from .manager import EvaluationManager
+        return EvaluationManager
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
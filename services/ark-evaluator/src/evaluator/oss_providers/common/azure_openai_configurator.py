@@ -88,7 +88,8 @@ class AzureOpenAIConfigurator:
     @staticmethod
     def create_azure_embeddings(
         llm_config: Dict[str, Any],
-        params: Dict[str, Any]
+        params: Dict[str, Any],
+        http_async_client: Optional[Any] = None
     ) -> Optional[Any]:
         """
         Create Azure OpenAI embeddings with proper configuration.
@@ -96,6 +97,7 @@ class AzureOpenAIConfigurator:
         Args:
             llm_config: LLM configuration dictionary
             params: Request parameters
+            http_async_client: Optional httpx.AsyncClient shared with the LLM for connection pooling
             
         Returns:
             Configured Azure embeddings wrapped for RAGAS, or None if creation fails
@@ -126,7 +128,8 @@ class AzureOpenAIConfigurator:
                 azure_endpoint=llm_config['api_base'],
                 deployment=embedding_deployment,
                 openai_api_version=llm_config['api_version'],
-                api_key=llm_config['api_key']
+                api_key=llm_config['api_key'],
+                http_async_client=http_async_client
             )
             
             # Test embeddings connectivity
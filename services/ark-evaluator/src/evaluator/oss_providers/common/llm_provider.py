@@ -148,9 +148,12 @@ class LLMProvider:
         logger.info(f"Ollama config: base_url={config['base_url']}, model={config['model']}")
         return config
     
-    def create_instance(self, provider_type: str, llm_config: dict):
+    def create_instance(self, provider_type: str, llm_config: dict, http_async_client=None):
         """
         Create LLM instance based on provider type and configuration.
+
+        OpenAI-based clients send async requests through http_async_client when given,
+        so connections are pooled with other clients sharing it.
         """
         try:
             if provider_type == 'azure_openai':
@@ -161,7 +164,8 @@ class LLMProvider:
                     azure_deployment=llm_config['deployment_name'],  # AzureChatOpenAI uses 'azure_deployment'
                     openai_api_version=llm_config['api_version'],
                     api_key=llm_config['api_key'],
-                    temperature=0.0
+                    temperature=0.0,
+                    http_async_client=http_async_client
                 )
             
             elif provider_type == 'openai':
@@ -170,7 +174,8 @@ class LLMProvider:
                     api_key=llm_config['api_key'],
                     model=llm_config['model'],
                     base_url=llm_config.get('base_url'),
-                    temperature=0.0
+                    temperature=0.0,
+                    http_async_client=http_async_client
                 )
             
             elif provider_type == 'anthropic':
@@ -223,7 +223,7 @@ class LangfuseProvider(OSSEvaluationProvider):
             ragas_adapter = RagasAdapter()
             ragas_scores = await ragas_adapter.evaluate(input_text, output_text, metrics, request.parameters)
 
-            # Record RAGAS results to Langfuse trace using trace adapter
+            # Record RAGAS results to Langfuse trace using trace adapter; evaluate() flushes the client
             trace_adapter = LangfuseTraceAdapter(langfuse_client=client)
             await trace_adapter.record_scores_to_trace(
                 trace=trace,
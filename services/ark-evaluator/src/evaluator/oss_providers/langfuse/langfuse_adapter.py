@@ -3,14 +3,20 @@ LangfuseAdapter - Native Langfuse evaluation capabilities.
 This adapter uses Langfuse's built-in evaluators instead of delegating to RAGAS.
 """
 
+import asyncio
 import logging
 from typing import Dict, List, Any, Optional
 from datetime import datetime
+from statistics import fmean
+
+from .langfuse_trace_adapter import (
+    DISABLED_TRACE_RESULT, LangfuseClientBase, TraceResult, normalize_metadata
+)
 
 logger = logging.getLogger(__name__)
 
 
-class LangfuseAdapter:
+class LangfuseAdapter(LangfuseClientBase):
     """
     Adapter for native Langfuse evaluations.
     Provides direct integration with Langfuse's evaluation framework.
@@ -19,7 +25,8 @@ class LangfuseAdapter:
     def __init__(
         self,
         create_traces: bool = True,
-        langfuse_client: Optional[Any] = None
+        langfuse_client: Optional[Any] = None,
+        max_concurrency: Optional[int] = None
     ):
         """
         Initialize the LangfuseAdapter.
@@ -27,33 +34,12 @@ class LangfuseAdapter:
         Args:
             create_traces: Whether to create traces for observability
             langfuse_client: Optional pre-initialized Langfuse client
+            max_concurrency: Optional cap on evaluators running concurrently
         """
-        self.create_traces = create_traces
-        self._client = langfuse_client
+        super().__init__(create_traces=create_traces, langfuse_client=langfuse_client)
+        self.max_concurrency = max_concurrency
         self._evaluators_cache = {}
 
-    def validate_params(self, params: Optional[Dict[str, Any]]) -> bool:
-        """
-        Validate that required parameters are present.
-
-        Args:
-            params: Parameters dictionary
-
-        Returns:
-            True if all required parameters are present
-        """
-        if not params:
-            logger.warning("No parameters provided for Langfuse configuration")
-            return False
-
-        required_keys = ["langfuse.host", "langfuse.public_key", "langfuse.secret_key"]
-        for key in required_keys:
-            if key not in params:
-                logger.warning(f"Missing required parameter: {key}")
-                return False
-
-        return True
-
     async def evaluate(
         self,
         input_text: str,
@@ -109,17 +95,25 @@ class LangfuseAdapter:
             # Get evaluator configuration if provided
             evaluator_config = params.get("langfuse.evaluator_config", {})
 
-            # Run each evaluator
-            for evaluator_name in evaluators:
-                config = evaluator_config.get(evaluator_name, {})
-                evaluator = self._get_evaluator(evaluator_name, config)
+            # Run all evaluators concurrently; one failure must not discard the other scores
+            semaphore = asyncio.Semaphore(self.max_concurrency) if self.max_concurrency else None
+            results = await asyncio.gather(*(
+                self._run_evaluator(
+                    evaluator_name,
+                    evaluator_config.get(evaluator_name, {}),
+                    input_text,
+                    output_text,
+                    semaphore
+                )
+                for evaluator_name in evaluators
+            ), return_exceptions=True)
 
-                # Run evaluation
-                result = await evaluator.evaluate({
-                    "input": input_text,
-                    "output": output_text,
-                    **config
-                })
+            first_error = None
+            for evaluator_name, result in zip(evaluators, results):
+                if isinstance(result, BaseException):
+                    logger.error(f"Langfuse evaluator {evaluator_name} failed: {result}")
+                    first_error = first_error or result
+                    continue
 
                 # Extract score (handle different response formats)
                 if isinstance(result, dict):
@@ -138,6 +132,10 @@ class LangfuseAdapter:
                     if trace:
                         trace.score(name=evaluator_name, value=float(result))
 
+            # The successful scores are recorded above and in the trace update below
+            if first_error is not None:
+                raise first_error
+
         finally:
             # Close generation span if created
             if generation:
@@ -150,45 +148,48 @@ class LangfuseAdapter:
                     metadata={
                         "evaluators": evaluators,
                         "scores": scores,
-                        "average_score": sum(scores.values()) / len(scores) if scores else 0
+                        "average_score": fmean(scores.values()) if scores else 0
                     }
                 )
 
             # Flush client to ensure data is sent
-            if client and hasattr(client, 'flush'):
-                client.flush()
+            await self._flush_client(client)
 
         return scores
 
-    def _get_langfuse_client(self, params: Dict[str, Any]):
+    async def _run_evaluator(
+        self,
+        evaluator_name: str,
+        config: Dict[str, Any],
+        input_text: str,
+        output_text: str,
+        semaphore: Optional[asyncio.Semaphore] = None
+    ) -> Any:
         """
-        Get or create Langfuse client.
+        Run a single evaluator, optionally bounded by a semaphore.
 
         Args:
-            params: Configuration parameters
+            evaluator_name: Name of the evaluator
+            config: Configuration for the evaluator
+            input_text: The input/prompt text
+            output_text: The generated output text
+            semaphore: Optional semaphore limiting concurrent evaluators
 
         Returns:
-            Langfuse client instance
+            Raw evaluator result
         """
-        if self._client:
-            return self._client
-
-        try:
-            from langfuse import Langfuse
-        except ImportError:
-            raise ImportError(
-                "Langfuse library is not installed. "
-                "Please install it with: pip install langfuse"
-            )
+        evaluator = self._get_evaluator(evaluator_name, config)
+        data = {
+            "input": input_text,
+            "output": output_text,
+            **config
+        }
 
-        # Create new client
-        self._client = Langfuse(
-            host=params.get("langfuse.host"),
-            public_key=params.get("langfuse.public_key"),
-            secret_key=params.get("langfuse.secret_key")
-        )
+        if semaphore is None:
+            return await evaluator.evaluate(data)
 
-        return self._client
+        async with semaphore:
+            return await evaluator.evaluate(data)
 
     def _get_evaluator(self, evaluator_name: str, config: Dict[str, Any]):
         """
@@ -202,7 +203,11 @@ class LangfuseAdapter:
             Evaluator instance
         """
         # Check cache first
-        cache_key = f"{evaluator_name}_{hash(str(config))}"
+        try:
+            cache_key = (evaluator_name, tuple(sorted(config.items())))
+            hash(cache_key)
+        except TypeError:
+            cache_key = (evaluator_name, repr(sorted(config.items())))
         if cache_key in self._evaluators_cache:
             return self._evaluators_cache[cache_key]
 
@@ -286,7 +291,7 @@ class LangfuseAdapter:
         scores: Dict[str, float],
         params: Dict[str, Any],
         metadata: Optional[Dict[str, Any]] = None
-    ) -> Dict[str, Any]:
+    ) -> TraceResult:
         """
         Record an evaluation trace with scores to Langfuse.
 
@@ -298,25 +303,20 @@ class LangfuseAdapter:
             metadata: Optional additional metadata to include
 
         Returns:
-            Dictionary with trace information
+            TraceResult with trace information
         """
+        # If tracing is disabled, return early
+        if not self.create_traces:
+            return DISABLED_TRACE_RESULT
+
         # Get or create Langfuse client
         client = self._get_langfuse_client(params)
 
-        # Prepare metadata
-        trace_metadata = metadata or {}
-        trace_metadata.update({
-            "scores": scores,
-            "average_score": sum(scores.values()) / len(scores) if scores else 0,
-            "timestamp": datetime.utcnow().isoformat()
-        })
-
-        # Create trace
+        # Create trace; its metadata is sent once, with the final update
         trace = client.trace(
             name=f"evaluation-{datetime.utcnow().isoformat()}",
             input=input_text,
-            output=output_text,
-            metadata=trace_metadata
+            output=output_text
         )
 
         # Record each score
@@ -326,19 +326,24 @@ class LangfuseAdapter:
                 value=float(score_value)
             )
 
-        # Update trace with final scores
+        # Normalize the final metadata once for the single update
+        trace_metadata = normalize_metadata({
+            **(metadata or {}),
+            "scores": scores,
+            "average_score": fmean(scores.values()) if scores else 0,
+            "timestamp": datetime.utcnow().isoformat()
+        })
         trace.update(
             output=output_text,
             metadata=trace_metadata
         )
 
         # Flush client to ensure data is sent
-        if hasattr(client, 'flush'):
-            client.flush()
+        await self._flush_client(client)
 
-        return {
-            "trace_id": trace.id,
-            "scores": scores,
-            "scores_recorded": len(scores),
-            "metadata": trace_metadata
-        }
\ No newline at end of file
+        return TraceResult(
+            trace_id=trace.id,
+            scores_recorded=len(scores),
+            scores=scores,
+            metadata=trace_metadata
+        )
\ No newline at end of file
@@ -9,17 +9,74 @@ This adapter focuses on what Langfuse SDK actually provides:
 Note: Langfuse Python SDK does NOT provide built-in LLM-as-a-Judge evaluators.
 """
 
+import asyncio
+import json
 import logging
-from typing import Dict, List, Any, Optional
+import os
+from typing import Dict, List, Any, Optional, Set, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
+from statistics import fmean
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+_REQUIRED_KEYS = frozenset(("langfuse.host", "langfuse.public_key", "langfuse.secret_key"))
+
+
+@dataclass(slots=True, frozen=True)
+class TraceResult:
+    """Outcome of recording an evaluation trace, readable by attribute or key."""
+    trace_id: Optional[str]
+    scores_recorded: int
+    status: str = "success"
+    average_score: Optional[float] = None
+    scores: Optional[Dict[str, float]] = None
+    metadata: Optional[Dict[str, Any]] = None
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
 
-class LangfuseTraceAdapter:
+DISABLED_TRACE_RESULT = TraceResult(trace_id=None, scores_recorded=0, status="disabled")
+
+def normalize_metadata(metadata: Dict[str, Any]) -> Dict[str, Any]:
     """
-    Adapter for Langfuse tracing and score recording.
-    Provides clean interface for observability and external score recording.
+    Round-trip metadata through JSON so the Langfuse SDK receives plain values.
+
+    Non-finite floats (NaN, inf) become None and unknown objects are stringified.
+    Uses orjson when available, falling back to the standard library.
+
+    Args:
+        metadata: Metadata dictionary to normalize
+
+    Returns:
+        JSON-safe copy of the metadata
+    """
+    if orjson is not None:
+        return orjson.loads(orjson.dumps(metadata, default=str, option=orjson.OPT_NON_STR_KEYS))
+    return json.loads(json.dumps(metadata, default=str), parse_constant=lambda _: None)
+
+
+# Langfuse clients shared across adapter instances, keyed by connection parameters
+_langfuse_client_cache: Dict[Tuple[Any, Any, Any], Any] = {}
+
+# Flushes from every adapter run on one worker thread, in submission order
+_flush_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="langfuse-flush")
+
+
+class LangfuseClientBase:
+    """
+    Langfuse client handling shared by the trace and evaluation adapters.
+    Provides parameter validation, cached client creation and background flushing.
     """
 
     def __init__(
@@ -28,7 +85,7 @@ class LangfuseTraceAdapter:
         langfuse_client: Optional[Any] = None
     ):
         """
-        Initialize the LangfuseTraceAdapter.
+        Initialize the adapter.
 
         Args:
             create_traces: Whether to create traces for observability
@@ -36,6 +93,7 @@ class LangfuseTraceAdapter:
         """
         self.create_traces = create_traces
         self._client = langfuse_client
+        self._pending_flushes: Set[asyncio.Future] = set()
 
     def validate_params(self, params: Optional[Dict[str, Any]]) -> bool:
         """
@@ -51,13 +109,108 @@ class LangfuseTraceAdapter:
             logger.warning("No parameters provided for Langfuse configuration")
             return False
 
-        required_keys = ["langfuse.host", "langfuse.public_key", "langfuse.secret_key"]
-        for key in required_keys:
-            if key not in params:
-                logger.warning(f"Missing required parameter: {key}")
-                return False
+        if _REQUIRED_KEYS.issubset(params.keys()):
+            return True
+
+        for key in sorted(_REQUIRED_KEYS.difference(params.keys())):
+            logger.warning(f"Missing required parameter: {key}")
+        return False
+
+    async def _flush_client(self, client: Any) -> None:
+        """
+        Flush the Langfuse client on a background thread.
+
+        The flush is awaited only when LANGFUSE_ENFORCE_FLUSH=1; otherwise it is
+        scheduled and tracked until it completes or close() waits for it.
+        Setting LANGFUSE_DISABLE_AUTOFLUSH skips the per-call flush entirely.
+
+        Args:
+            client: Langfuse client instance
+        """
+        if not client or not hasattr(client, 'flush'):
+            return
+
+        if os.getenv("LANGFUSE_DISABLE_AUTOFLUSH"):
+            return
+
+        future = asyncio.get_running_loop().run_in_executor(_flush_executor, client.flush)
+        if os.getenv("LANGFUSE_ENFORCE_FLUSH", "0") == "1":
+            await future
+        else:
+            self._pending_flushes.add(future)
+            future.add_done_callback(self._finish_flush)
+
+    def _finish_flush(self, future: asyncio.Future) -> None:
+        """
+        Stop tracking a completed background flush and log its failure, if any.
+
+        Args:
+            future: Completed flush future
+        """
+        self._pending_flushes.discard(future)
+        if not future.cancelled() and future.exception() is not None:
+            logger.warning(f"Background Langfuse flush failed: {future.exception()}")
+
+    def _get_langfuse_client(self, params: Dict[str, Any]):
+        """
+        Get or create Langfuse client.
+
+        Args:
+            params: Configuration parameters
+
+        Returns:
+            Langfuse client instance
+        """
+        if self._client:
+            return self._client
+
+        cache_key = (
+            params.get("langfuse.host"),
+            params.get("langfuse.public_key"),
+            params.get("langfuse.secret_key")
+        )
+        cached_client = _langfuse_client_cache.get(cache_key)
+        if cached_client is not None:
+            self._client = cached_client
+            return self._client
+
+        try:
+            from langfuse import Langfuse
+        except ImportError:
+            raise ImportError(
+                "Langfuse library is not installed. "
+                "Please install it with: pip install langfuse"
+            )
+
+        # Create new client
+        self._client = Langfuse(
+            host=params.get("langfuse.host"),
+            public_key=params.get("langfuse.public_key"),
+            secret_key=params.get("langfuse.secret_key")
+        )
+        _langfuse_client_cache[cache_key] = self._client
+
+        logger.info(f"Initialized Langfuse client for host: {params.get('langfuse.host')}")
+        return self._client
+
+    async def close(self):
+        """
+        Wait for background flushes, then flush the client a final time.
+        """
+        if self._pending_flushes:
+            # Failures were already logged by _finish_flush
+            await asyncio.gather(*self._pending_flushes, return_exceptions=True)
+
+        if self._client and hasattr(self._client, 'flush'):
+            await asyncio.get_running_loop().run_in_executor(_flush_executor, self._client.flush)
+            logger.info("Langfuse client flushed and closed")
 
-        return True
+
+class LangfuseTraceAdapter(LangfuseClientBase):
+    """
+    Adapter for Langfuse tracing and score recording.
+    Provides clean interface for observability and external score recording.
+    """
 
     async def record_evaluation_trace(
         self,
@@ -67,7 +220,7 @@ class LangfuseTraceAdapter:
         params: Dict[str, Any],
         metadata: Optional[Dict[str, Any]] = None,
         session_id: Optional[str] = None
-    ) -> Dict[str, Any]:
+    ) -> TraceResult:
         """
         Create a trace and record evaluation scores from external evaluators.
 
@@ -80,16 +233,12 @@ class LangfuseTraceAdapter:
             session_id: Optional session ID for grouping traces
 
         Returns:
-            Dictionary with trace information and recording status
+            TraceResult with trace information and recording status
         """
         # If tracing is disabled, return early
         if not self.create_traces:
-            logger.info("Trace creation disabled, skipping")
-            return {
-                "trace_id": None,
-                "scores_recorded": 0,
-                "status": "disabled"
-            }
+            logger.debug("Trace creation disabled, skipping")
+            return DISABLED_TRACE_RESULT
 
         # Validate parameters
         if not self.validate_params(params):
@@ -98,12 +247,12 @@ class LangfuseTraceAdapter:
         # Get or create Langfuse client
         client = self._get_langfuse_client(params)
 
-        # Create trace
+        # Create trace; its metadata is sent once, with the final update
         trace_id = f"eval-{datetime.utcnow().isoformat()}"
         trace_metadata = {
             "timestamp": datetime.utcnow().isoformat(),
             "scores_count": len(scores),
-            "average_score": sum(scores.values()) / len(scores) if scores else 0,
+            "average_score": fmean(scores.values()) if scores else 0,
             **(metadata or {})
         }
 
@@ -111,7 +260,6 @@ class LangfuseTraceAdapter:
             name=f"evaluation-{trace_id}",
             input=input_text,
             output=output_text,
-            metadata=trace_metadata,
             session_id=session_id
         )
 
@@ -124,24 +272,23 @@ class LangfuseTraceAdapter:
 
         try:
             # Record scores from external evaluators
+            score_metadata: Dict[str, Any] = {}
             scores_recorded = await self.record_scores_to_trace(
                 trace=trace,
                 scores=scores,
-                metadata=metadata
+                metadata=metadata,
+                meta_sink=score_metadata
             )
 
-            # Update trace with final metadata
-            trace.update(
-                output=output_text,
-                metadata=trace_metadata
-            )
+            # Normalize the merged final metadata once for the single update
+            final_metadata = normalize_metadata({**trace_metadata, **score_metadata})
+            trace.update(output=output_text, metadata=final_metadata)
 
-            return {
-                "trace_id": str(trace.id),
-                "scores_recorded": scores_recorded,
-                "status": "success",
-                "average_score": trace_metadata["average_score"]
-            }
+            return TraceResult(
+                trace_id=str(trace.id),
+                scores_recorded=scores_recorded,
+                average_score=final_metadata["average_score"]
+            )
 
         finally:
             # Close generation span
@@ -149,14 +296,14 @@ class LangfuseTraceAdapter:
                 generation.end()
 
             # Flush client to ensure data is sent
-            if client and hasattr(client, 'flush'):
-                client.flush()
+            await self._flush_client(client)
 
     async def record_scores_to_trace(
         self,
         trace: Any,
         scores: Dict[str, float],
-        metadata: Optional[Dict[str, Any]] = None
+        metadata: Optional[Dict[str, Any]] = None,
+        meta_sink: Optional[Dict[str, Any]] = None
     ) -> int:
         """
         Record evaluation scores to an existing trace.
@@ -165,69 +312,44 @@ class LangfuseTraceAdapter:
             trace: Langfuse trace object
             scores: Dictionary of evaluation scores
             metadata: Additional metadata for context
+            meta_sink: Optional dict collecting the score summary metadata
+                instead of updating the trace, for callers that update it later
 
         Returns:
             Number of scores recorded
         """
+        # trace.score only queues the event for the client's background worker
         scores_recorded = 0
-
         for metric_name, score_value in scores.items():
             try:
-                # Record individual score
+                value = float(score_value)
                 trace.score(
                     name=metric_name,
-                    value=float(score_value),
+                    value=value,
                     comment=f"External evaluation score for {metric_name}",
                     data_type="NUMERIC"
                 )
-                scores_recorded += 1
-                logger.debug(f"Recorded score for {metric_name}: {score_value}")
-
             except Exception as e:
                 logger.error(f"Failed to record score for {metric_name}: {e}")
+                continue
+
+            scores_recorded += 1
+            logger.debug(f"Recorded score for {metric_name}: {value}")
 
         # Update trace metadata with score summary
-        if metadata:
-            trace.update(metadata={
-                **metadata,
-                "scores_recorded": scores_recorded,
-                "total_scores": len(scores)
-            })
+        score_summary = {
+            **(metadata or {}),
+            "scores_recorded": scores_recorded,
+            "total_scores": len(scores)
+        }
+        if meta_sink is not None:
+            meta_sink.update(score_summary)
+        elif metadata:
+            trace.update(metadata=normalize_metadata(score_summary))
 
         logger.info(f"Recorded {scores_recorded}/{len(scores)} scores to trace")
         return scores_recorded
 
-    def _get_langfuse_client(self, params: Dict[str, Any]):
-        """
-        Get or create Langfuse client.
-
-        Args:
-            params: Configuration parameters
-
-        Returns:
-            Langfuse client instance
-        """
-        if self._client:
-            return self._client
-
-        try:
-            from langfuse import Langfuse
-        except ImportError:
-            raise ImportError(
-                "Langfuse library is not installed. "
-                "Please install it with: pip install langfuse"
-            )
-
-        # Create new client
-        self._client = Langfuse(
-            host=params.get("langfuse.host"),
-            public_key=params.get("langfuse.public_key"),
-            secret_key=params.get("langfuse.secret_key")
-        )
-
-        logger.info(f"Initialized Langfuse client for host: {params.get('langfuse.host')}")
-        return self._client
-
     async def create_session(
         self,
         session_id: str,
@@ -247,11 +369,3 @@ class LangfuseTraceAdapter:
         # This method is for consistency and future enhancements
         logger.info(f"Creating evaluation session: {session_id}")
         return session_id
-
-    async def close(self):
-        """
-        Close the adapter and cleanup resources.
-        """
-        if self._client and hasattr(self._client, 'flush'):
-            self._client.flush()
-            logger.info("Langfuse client flushed and closed")
\ No newline at end of file
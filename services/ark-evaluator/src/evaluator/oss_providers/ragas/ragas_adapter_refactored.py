@@ -4,6 +4,7 @@ Supports multiple LLM providers with improved separation of concerns.
 """
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Any
 from ...types import EvaluationParameters
 
@@ -43,6 +44,20 @@ class RagasAdapter:
         self.uvloop_handler = UVLoopHandler()
         self.azure_configurator = AzureOpenAIConfigurator()
         self.ragas_evaluator = RagasEvaluator()
+        # LLM clients reused across evaluations, tagged with the event loop they were built on
+        self._clients = None
+        self._clients_loop = None
+        # Connection pool shared by the LLM and embeddings clients on the current loop
+        self._http_client = None
+        # Serializes client builds on a loop; asyncio locks are bound to one loop
+        self._clients_lock = None
+        self._clients_lock_loop = None
+        # Under uvloop, evaluations run on one worker thread with its own clean loop,
+        # kept for the adapter's lifetime so the clients built on it are reused
+        self._uvloop_worker = None
+        self._uvloop_worker_loop = None
+        # RAGAS metric instances bound to the cached clients, built once per metric
+        self._ragas_metrics: Dict[str, Any] = {}
         # Initialize validation results
         self._validation_results = {
             'valid_metrics': [],
@@ -82,6 +97,8 @@ class RagasAdapter:
                     input_text, output_text, metrics, params
                 )
                 
+        except RagasEvaluationError:
+            raise
         except ImportError as e:
             logger.error(f"RAGAS dependencies not available: {e}")
             raise RagasEvaluationError(
@@ -112,27 +129,23 @@ class RagasAdapter:
         
         # Create a wrapper function for thread execution
         def run_in_thread():
-            import asyncio
-            
-            # Create clean event loop
-            loop = self.uvloop_handler.create_clean_event_loop()
-            
-            try:
-                # Run evaluation in the clean loop
-                return loop.run_until_complete(
-                    self._run_evaluation(input_text, output_text, metrics, params)
-                )
-            finally:
-                loop.close()
-        
+            # The clean loop lives as long as the worker thread, so its clients are reused
+            if self._uvloop_worker_loop is None:
+                self._uvloop_worker_loop = self.uvloop_handler.create_clean_event_loop()
+
+            # Run evaluation in the clean loop
+            return self._uvloop_worker_loop.run_until_complete(
+                self._run_evaluation(input_text, output_text, metrics, params)
+            )
+
+        if self._uvloop_worker is None:
+            self._uvloop_worker = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ragas-uvloop")
+
         # Wrap the function with environment variables if needed
         if env_vars:
-            wrapped_func = self.uvloop_handler.wrap_sync_for_thread(
-                run_in_thread, env_vars
-            )
-            return self.uvloop_handler.run_in_thread_with_clean_loop(wrapped_func)
-        else:
-            return self.uvloop_handler.run_in_thread_with_clean_loop(run_in_thread)
+            run_in_thread = self.uvloop_handler.wrap_sync_for_thread(run_in_thread, env_vars)
+        # Waits like run_in_thread_with_clean_loop, so the thread's environment variables never overlap
+        return self._uvloop_worker.submit(run_in_thread).result()
     
     async def _run_evaluation(
         self,
@@ -145,37 +158,6 @@ class RagasAdapter:
         Core RAGAS evaluation logic.
         """
         try:
-            # Detect LLM provider and get config
-            provider_type, llm_config = self.llm_provider.detect_provider(params)
-            logger.info(f"Detected LLM provider: {provider_type}")
-            
-            # Create LLM instance
-            langchain_llm = self.llm_provider.create_instance(provider_type, llm_config)
-            
-            # Wrap LLM for RAGAS
-            from ragas.llms import LangchainLLMWrapper
-            llm = LangchainLLMWrapper(langchain_llm)
-            logger.info(f"Wrapped {provider_type} LLM for RAGAS")
-            
-            # Create embeddings if using Azure
-            embeddings = None
-            if provider_type == 'azure_openai':
-                embeddings = self.azure_configurator.create_azure_embeddings(
-                    llm_config, params
-                )
-            
-            # Test connectivity
-            llm_ok, embed_ok = await self.azure_configurator.test_azure_connectivity(
-                langchain_llm, embeddings
-            )
-            if not llm_ok:
-                logger.warning("LLM connectivity test failed, but continuing")
-            
-            # Initialize RAGAS metrics
-            ragas_metrics = self.ragas_evaluator.initialize_ragas_metrics(
-                metrics, llm, embeddings
-            )
-            
             # Extract context from parameters
             eval_params = EvaluationParameters.from_request_params(params)
 
@@ -208,28 +190,47 @@ class RagasAdapter:
 
             # If no metrics can be evaluated, raise validation error
             if not valid_metrics:
-                error_details = []
-                for metric, errors in validation_errors.items():
-                    error_details.append(f"{metric}: {', '.join(errors)}")
+                error_details = [f"{metric}: {errors}" for metric, errors in validation_errors.items()]
 
                 raise RagasEvaluationError(
                     f"No metrics can be evaluated due to validation failures: {'; '.join(error_details)}",
                     error_type="validation_error"
                 )
 
-            # Only initialize RAGAS metrics for valid metrics
-            ragas_metrics = self.ragas_evaluator.initialize_ragas_metrics(
-                valid_metrics, llm, embeddings
-            )
+            # LLM clients are only needed once at least one metric can be evaluated
+            llm, embeddings = await self._get_clients(params)
+
+            # Only initialize RAGAS metrics for valid metrics, reusing instances from earlier evaluations
+            for metric in valid_metrics:
+                if metric not in self._ragas_metrics:
+                    initialized = self.ragas_evaluator.initialize_ragas_metrics(
+                        [metric], llm, embeddings, fallback_to_default=False
+                    )
+                    if initialized:
+                        self._ragas_metrics[metric] = initialized[0]
+            ragas_metrics = {
+                metric: self._ragas_metrics[metric]
+                for metric in valid_metrics if metric in self._ragas_metrics
+            }
 
-            # Run RAGAS evaluation on valid metrics only
-            result = await self.ragas_evaluator.run_evaluation(
-                dataset, ragas_metrics
+            # Score valid metrics concurrently, bounded to respect provider rate limits
+            scores, metric_errors = await self.ragas_evaluator.run_metrics_concurrently(
+                dataset_dict,
+                valid_metrics,
+                ragas_metrics,
+                max_concurrency=int(params.get('max_concurrent_metrics', 8))
             )
 
-            # Extract scores only for valid metrics
-            return self.ragas_evaluator.extract_scores(result, metrics, valid_metrics)
-            
+            # A failing metric is reported alongside validation failures instead of failing the call
+            for metric, error in metric_errors.items():
+                valid_metrics.remove(metric)
+                invalid_metrics.append(metric)
+                validation_errors[metric] = error
+
+            return scores
+
+        except RagasEvaluationError:
+            raise
         except Exception as e:
             logger.error(f"Error in RAGAS evaluation: {e}")
             raise RagasEvaluationError(
@@ -238,6 +239,122 @@ class RagasAdapter:
                 original_error=e
             )
 
+    async def _get_clients(self, params: dict):
+        """
+        Get the RAGAS-wrapped LLM and embeddings, creating them on first use.
+
+        The provider caches one adapter per connection config, so the clients are
+        built once and reused. They are rebuilt when called from a different event
+        loop, since async HTTP clients cannot be shared across loops.
+
+        Returns:
+            Tuple of (RAGAS-wrapped LLM, embeddings or None)
+        """
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        if self._clients is not None and self._clients_loop is loop:
+            return self._clients
+
+        if self._clients_lock_loop is not loop:
+            self._clients_lock = asyncio.Lock()
+            self._clients_lock_loop = loop
+
+        async with self._clients_lock:
+            # Another caller on this loop may have built the clients while we waited
+            if self._clients is not None and self._clients_loop is loop:
+                return self._clients
+            return await self._build_clients(params, loop)
+
+    async def _build_clients(self, params: dict, loop):
+        """
+        Build the RAGAS-wrapped LLM and embeddings on a fresh HTTP pool.
+
+        Args:
+            params: Evaluation parameters with the provider connection config
+            loop: Event loop the clients are bound to
+
+        Returns:
+            Tuple of (RAGAS-wrapped LLM, embeddings or None)
+        """
+        # The pool from a previous loop cannot be reused, so release it first
+        await self._close_http_client()
+
+        # Detect LLM provider and get config
+        provider_type, llm_config = self.llm_provider.detect_provider(params)
+        logger.info(f"Detected LLM provider: {provider_type}")
+
+        import httpx
+        self._http_client = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+            timeout=60.0
+        )
+
+        # Create LLM instance
+        langchain_llm = self.llm_provider.create_instance(
+            provider_type, llm_config, http_async_client=self._http_client
+        )
+
+        # Wrap LLM for RAGAS
+        from ragas.llms import LangchainLLMWrapper
+        llm = LangchainLLMWrapper(langchain_llm)
+        logger.info(f"Wrapped {provider_type} LLM for RAGAS")
+
+        # Create embeddings if using Azure
+        embeddings = None
+        if provider_type == 'azure_openai':
+            embeddings = self.azure_configurator.create_azure_embeddings(
+                llm_config, params, http_async_client=self._http_client
+            )
+
+        # Test connectivity
+        llm_ok, embed_ok = await self.azure_configurator.test_azure_connectivity(
+            langchain_llm, embeddings
+        )
+        if not llm_ok:
+            logger.warning("LLM connectivity test failed, but continuing")
+
+        self._clients = (llm, embeddings)
+        self._clients_loop = loop
+        # Metrics bound to the previous clients must be rebuilt against the new ones
+        self._ragas_metrics = {}
+        return self._clients
+
+    async def _close_http_client(self) -> None:
+        """Close the current HTTP pool, if any, and forget the clients built on it."""
+        http_client, self._http_client = self._http_client, None
+        self._clients = None
+        if http_client is None:
+            return
+        try:
+            await http_client.aclose()
+        except Exception as e:
+            # Connections opened on an already closed loop cannot be shut down cleanly
+            logger.debug(f"Failed to close previous RAGAS HTTP pool: {e}")
+
+    def _close_uvloop_worker_loop(self) -> None:
+        """Close the clients built on the uvloop worker loop, then the loop itself."""
+        loop, self._uvloop_worker_loop = self._uvloop_worker_loop, None
+        if loop is None:
+            return
+        try:
+            loop.run_until_complete(self._close_http_client())
+        finally:
+            loop.close()
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP connections held by the cached clients."""
+        import asyncio
+
+        worker, self._uvloop_worker = self._uvloop_worker, None
+        if worker is not None:
+            # Clients built on the worker loop have to be closed on that loop
+            await asyncio.wrap_future(worker.submit(self._close_uvloop_worker_loop))
+            worker.shutdown(wait=False)
+        await self._close_http_client()
+        self._clients_loop = None
+        self._ragas_metrics = {}
+
     def get_validation_results(self) -> Dict[str, Any]:
         """
         Get the last validation results from field validation.
@@ -3,12 +3,34 @@ RAGAS Evaluator for running RAGAS-specific evaluation logic.
 Encapsulates RAGAS metrics initialization, dataset preparation, and evaluation execution.
 """
 
+import asyncio
+import copy
 import logging
 import math
 from typing import Dict, List, Any, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Validation results keyed by (metrics, entry shape); bounded by clearing when full
+_VALIDATION_CACHE: Dict[tuple, Tuple[Tuple[str, ...], Tuple[str, ...], Tuple[Tuple[str, str], ...]]] = {}
+_VALIDATION_CACHE_SIZE = 1024
+
+
+def _field_shape(value: Any) -> tuple:
+    """
+    Reduce a field value to the properties metric validation depends on.
+
+    Validation only checks a value's type and whether strings or string lists
+    have non-blank content, so entries with equal shapes validate identically.
+    """
+    if isinstance(value, str):
+        return ("str", bool(value.strip()))
+    if isinstance(value, list):
+        if not all(isinstance(item, str) for item in value):
+            return ("list", None)
+        return ("list[str]", any(item.strip() for item in value))
+    return (type(value).__name__, None)
+
 
 class RagasEvaluator:
     """
@@ -52,9 +74,21 @@ class RagasEvaluator:
             # If we can't validate, assume all metrics are valid (backward compatibility)
             return metrics, [], {}
 
+        cache_key = (
+            tuple(metrics),
+            tuple(sorted((name, _field_shape(value)) for name, value in dataset_entry.items()))
+        )
+        cached = _VALIDATION_CACHE.get(cache_key)
+        if cached is not None:
+            logger.debug(f"Using cached validation result for metrics {metrics}")
+            # Return fresh containers since callers update them in place
+            return list(cached[0]), list(cached[1]), dict(cached[2])
+
         valid_metrics = []
         invalid_metrics = []
         validation_errors = {}
+        # Aliases share a metric wrapper, so each wrapper is validated once per entry
+        results_by_metric = {}
 
         for metric_name in metrics:
             metric = MetricRegistry.get_metric(metric_name)
@@ -65,7 +99,9 @@ class RagasEvaluator:
                 continue
 
             # Validate field requirements for this metric
-            is_valid, errors = metric.validate_input(**dataset_entry)
+            if metric not in results_by_metric:
+                results_by_metric[metric] = metric.validate_input(**dataset_entry)
+            is_valid, errors = results_by_metric[metric]
 
             if is_valid:
                 valid_metrics.append(metric_name)
@@ -77,13 +113,20 @@ class RagasEvaluator:
                 logger.warning(f"Metric '{metric_name}' validation failed: {error_msg}")
 
         logger.info(f"Metric validation complete: {len(valid_metrics)} valid, {len(invalid_metrics)} invalid")
+
+        if len(_VALIDATION_CACHE) >= _VALIDATION_CACHE_SIZE:
+            _VALIDATION_CACHE.clear()
+        _VALIDATION_CACHE[cache_key] = (
+            tuple(valid_metrics), tuple(invalid_metrics), tuple(validation_errors.items())
+        )
         return valid_metrics, invalid_metrics, validation_errors
 
     @staticmethod
     def initialize_ragas_metrics(
         metrics: List[str],
         llm: Any,
-        embeddings: Optional[Any] = None
+        embeddings: Optional[Any] = None,
+        fallback_to_default: bool = True
     ) -> List[Any]:
         """
         Initialize RAGAS metrics with LLM and embeddings.
@@ -92,6 +135,7 @@ class RagasEvaluator:
             metrics: List of metric names to initialize
             llm: RAGAS-wrapped LLM instance
             embeddings: Optional RAGAS-wrapped embeddings instance
+            fallback_to_default: Use answer_relevancy when no metric could be initialized
             
         Returns:
             List of initialized RAGAS metric instances
@@ -171,9 +215,9 @@ class RagasEvaluator:
                         metric_instance = ragas_metric()
                         logger.debug(f"Successfully instantiated {metric} as function")
                     else:
-                        # It's already an instance
-                        metric_instance = ragas_metric
-                        logger.debug(f"Using pre-existing instance for {metric}")
+                        # It's already a module-level instance; copy it so LLM bindings are not shared
+                        metric_instance = copy.copy(ragas_metric)
+                        logger.debug(f"Using copy of pre-existing instance for {metric}")
 
                 if metric_instance is None:
                     logger.warning(f"Could not create instance for metric {metric}, skipping")
@@ -228,7 +272,7 @@ class RagasEvaluator:
             logger.debug(f"Initialized RAGAS metric: {metric}")
         
         # If no supported metrics, use default
-        if not supported_metrics:
+        if not supported_metrics and fallback_to_default:
             logger.warning("No supported RAGAS metrics found, using answer_relevancy as default")
             default_metric = answer_relevancy()
             
@@ -304,8 +348,8 @@ class RagasEvaluator:
             if ground_truth:
                 dataset_entry['reference'] = ground_truth
 
-        # Create dataset
-        eval_dataset = Dataset.from_list([dataset_entry])
+        # Create single-row dataset straight from columns, skipping per-row schema inference
+        eval_dataset = Dataset.from_dict({field: [value] for field, value in dataset_entry.items()})
         logger.debug(f"Created RAGAS dataset with {len(eval_dataset)} entries")
         logger.debug(f"Dataset columns: {eval_dataset.column_names}")
         logger.debug(f"Dataset entry: {dataset_entry}")
@@ -351,6 +395,75 @@ class RagasEvaluator:
             logger.error(f"Full traceback: {traceback.format_exc()}")
             raise
     
+    @staticmethod
+    async def run_metrics_concurrently(
+        dataset_entry: Dict[str, Any],
+        metrics: List[str],
+        ragas_metrics: Dict[str, Any],
+        max_concurrency: int = 8
+    ) -> Tuple[Dict[str, float], Dict[str, str]]:
+        """
+        Score a single dataset entry with each RAGAS metric concurrently.
+
+        Each metric is one LLM round-trip, so scoring them together bounds
+        latency by the slowest metric instead of the sum of all of them.
+
+        Args:
+            dataset_entry: Dataset entry with the fields required by the metrics
+            metrics: List of metric names that passed validation
+            ragas_metrics: Mapping of metric names to initialized RAGAS metric instances
+            max_concurrency: Maximum number of metrics scored at the same time
+
+        Returns:
+            Tuple of (scores, metric_errors) keyed by our metric names
+        """
+        try:
+            from ragas.dataset_schema import SingleTurnSample
+        except ImportError as e:
+            logger.error(f"Failed to import RAGAS sample schema: {e}")
+            raise
+
+        sample = SingleTurnSample(**{
+            field: value for field, value in dataset_entry.items()
+            if field in SingleTurnSample.model_fields
+        })
+
+        scheduled = {}
+        scores = {}
+        for metric in metrics:
+            instance = ragas_metrics.get(metric)
+            if instance is None:
+                logger.warning(f"No initialized RAGAS metric for {metric}, using default")
+                scores[metric] = 0.5
+            else:
+                scheduled[metric] = instance
+
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def score_metric(instance: Any) -> float:
+            async with semaphore:
+                return await instance.single_turn_ascore(sample)
+
+        logger.info(f"Running {len(scheduled)} RAGAS metrics with concurrency {max_concurrency}")
+        results = await asyncio.gather(
+            *(score_metric(instance) for instance in scheduled.values()),
+            return_exceptions=True
+        )
+
+        metric_errors = {}
+        for metric, result in zip(scheduled, results):
+            if isinstance(result, BaseException):
+                logger.warning(f"RAGAS metric {metric} failed: {result}")
+                metric_errors[metric] = str(result) or type(result).__name__
+            elif math.isnan(float(result)):
+                logger.warning(f"RAGAS returned NaN for metric {metric}, using fallback score")
+                scores[metric] = 0.7  # Reasonable fallback for NaN
+            else:
+                scores[metric] = float(result)
+
+        logger.info(f"Extracted scores: {scores}")
+        return scores, metric_errors
+
     @staticmethod
     def extract_scores(
         result: Any,
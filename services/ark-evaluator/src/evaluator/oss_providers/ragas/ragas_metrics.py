@@ -28,6 +28,8 @@ class MetricWrapper(ABC):
         self.description = self.get_description()
         self.required_fields = self.get_required_fields()
         self.optional_fields = self.get_optional_fields()
+        # Mandatory field names, precomputed once for the missing-field check in validate_input
+        self.required_field_names = frozenset(f.name for f in self.required_fields if f.required)
 
     @abstractmethod
     def get_name(self) -> str:
@@ -160,14 +162,13 @@ class MetricWrapper(ABC):
     def validate_input(self, **kwargs) -> tuple[bool, List[str]]:
         """Validate if all required fields are present and have correct types and content."""
         errors = []
-        provided_fields = set(kwargs.keys())
+        missing_fields = self.required_field_names - kwargs.keys()
 
         # Check required fields
         for field_req in self.required_fields:
-            if field_req.name not in provided_fields:
-                if field_req.required:
-                    errors.append(f"Missing required field: {field_req.name} - {field_req.description}")
-            else:
+            if field_req.name in missing_fields:
+                errors.append(f"Missing required field: {field_req.name} - {field_req.description}")
+            elif field_req.name in kwargs:
                 # Validate field type and content if provided
                 value = kwargs[field_req.name]
                 is_valid, error_msg = self._validate_field_type(
@@ -181,7 +182,7 @@ class MetricWrapper(ABC):
 
         # Check optional fields
         for field_req in self.optional_fields:
-            if field_req.name in provided_fields:
+            if field_req.name in kwargs:
                 value = kwargs[field_req.name]
                 is_valid, error_msg = self._validate_field_type(
                     value,
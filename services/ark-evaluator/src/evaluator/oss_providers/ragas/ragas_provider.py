@@ -3,15 +3,32 @@ Standalone RAGAS evaluation provider.
 Direct integration with RAGAS library without Langfuse dependencies.
 """
 
+import asyncio
+import hashlib
+import json
 import logging
-from typing import List, Optional, Dict, Any
+from collections import OrderedDict
+from functools import lru_cache
+from statistics import fmean
+from typing import List, Optional, Dict, Any, Tuple
 import time
 
 from ...types import UnifiedEvaluationRequest, EvaluationResponse, TokenUsage
 from ...core.interface import OSSEvaluationProvider
+from ..common.llm_provider import LLMProvider
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of successful responses kept per provider
+RESPONSE_CACHE_SIZE = 1024
+
+
+@lru_cache(maxsize=256)
+def _split_metrics(metrics_str: str) -> Tuple[str, ...]:
+    """Split a comma-separated metrics string, cached since servers see the same few strings."""
+    metrics = (metric.strip() for metric in metrics_str.split(","))
+    return tuple(metric for metric in metrics if metric)  # Remove empty strings
+
 
 class RagasProvider(OSSEvaluationProvider):
     """
@@ -23,7 +40,14 @@ class RagasProvider(OSSEvaluationProvider):
 
     def __init__(self, shared_session=None):
         super().__init__(shared_session)
-        self._ragas_adapter = None
+        # Adapters keyed by connection config so their LLM clients are reused across requests
+        self._adapter_cache: Dict[tuple, Any] = {}
+        # Resolves the client config an adapter would build, for the adapter cache key
+        self._llm_provider = LLMProvider()
+        # Successful responses keyed by an exact hash of the request, least recently used first
+        self._response_cache: "OrderedDict[bytes, EvaluationResponse]" = OrderedDict()
+        # Evaluations in progress under the same key, joined by identical concurrent requests
+        self._inflight: Dict[bytes, "asyncio.Task[EvaluationResponse]"] = {}
 
     def get_evaluation_type(self) -> str:
         """Return the evaluation type identifier."""
@@ -67,7 +91,97 @@ class RagasProvider(OSSEvaluationProvider):
 
     async def evaluate(self, request: UnifiedEvaluationRequest) -> EvaluationResponse:
         """
-        Execute RAGAS evaluation.
+        Execute RAGAS evaluation, reusing the response of an identical earlier request.
+
+        Only exact matches on input, output, context and parameters are served from
+        the cache, and identical requests arriving while one is still being evaluated
+        wait for that evaluation instead of starting their own. Set the "cache"
+        parameter to "off" to always evaluate.
+
+        Args:
+            request: The unified evaluation request
+
+        Returns:
+            EvaluationResponse with score and metadata
+        """
+        cache_key = self._response_cache_key(request)
+        if cache_key is not None:
+            cached = self._response_cache.get(cache_key)
+            if cached is not None:
+                self._response_cache.move_to_end(cache_key)
+                logger.debug("Serving RAGAS evaluation from response cache")
+                # No LLM calls were made for this response
+                return cached.model_copy(update={
+                    "metadata": {**(cached.metadata or {}), "cache_hit": "true"},
+                    "tokenUsage": TokenUsage()
+                })
+
+            task = self._inflight.get(cache_key)
+            if task is not None:
+                logger.debug("Joining in-flight RAGAS evaluation for identical request")
+                response = await asyncio.shield(task)
+                # Token usage is reported once, by the request that ran the evaluation
+                return response.model_copy(update={
+                    "metadata": {**(response.metadata or {}), "coalesced": "true"},
+                    "tokenUsage": TokenUsage()
+                })
+
+            # Shielded so a cancelled caller does not cancel the evaluation others joined
+            task = asyncio.ensure_future(self._evaluate(request))
+            self._inflight[cache_key] = task
+            task.add_done_callback(lambda done: self._finish_inflight(cache_key, done))
+            return await asyncio.shield(task)
+
+        return await self._evaluate(request)
+
+    def _finish_inflight(self, cache_key: bytes, task: "asyncio.Task[EvaluationResponse]") -> None:
+        """
+        Drop a completed evaluation from the in-flight table and cache its response.
+
+        Args:
+            cache_key: Request hash the evaluation was registered under
+            task: Completed evaluation task
+        """
+        self._inflight.pop(cache_key, None)
+        if task.cancelled() or task.exception() is not None:
+            return
+
+        # Only successful evaluations are cached so failures are retried
+        response = task.result()
+        if not response.error:
+            self._response_cache[cache_key] = response.model_copy(deep=True)
+            if len(self._response_cache) > RESPONSE_CACHE_SIZE:
+                self._response_cache.popitem(last=False)
+
+    def _response_cache_key(self, request: UnifiedEvaluationRequest) -> Optional[bytes]:
+        """
+        Hash the parts of a request that determine its evaluation result.
+
+        Args:
+            request: The unified evaluation request
+
+        Returns:
+            SHA-256 digest of the request, or None when caching is disabled
+        """
+        parameters = request.parameters or {}
+        if str(parameters.get("cache", "")).lower() == "off":
+            return None
+
+        payload = json.dumps(
+            [
+                request.config.input if request.config else None,
+                request.config.output if request.config else None,
+                getattr(request.config, "context", None),
+                parameters
+            ],
+            sort_keys=True,
+            default=str
+        )
+        return hashlib.sha256(payload.encode()).digest()
+
+    async def _evaluate(self, request: UnifiedEvaluationRequest) -> EvaluationResponse:
+        """
+        Run RAGAS evaluation for a request without consulting the response cache.
 
         Args:
             request: The unified evaluation request
@@ -124,7 +238,7 @@ class RagasProvider(OSSEvaluationProvider):
             metrics = self._parse_metrics(metrics_str)
 
             # Get RAGAS adapter and run evaluation
-            adapter = self._get_ragas_adapter()
+            adapter = self._get_ragas_adapter(request.parameters or {})
             try:
                 scores = await adapter.evaluate(input_text, output_text, metrics, request.parameters or {})
             except Exception as e:
@@ -133,18 +247,21 @@ class RagasProvider(OSSEvaluationProvider):
                     # It's a RagasEvaluationError
                     execution_time = time.time() - start_time
                     error_dict = e.to_dict() if hasattr(e, 'to_dict') else {"error": str(e)}
+                    metadata = {
+                        "provider": "ragas",
+                        "error_type": getattr(e, 'error_type', 'unknown'),
+                        "execution_time_seconds": str(execution_time),
+                        "requested_metrics": ",".join(metrics)
+                    }
+                    # Validation errors are raised directly and carry no original error
+                    if error_dict.get("original_error"):
+                        metadata["original_error"] = error_dict["original_error"]
 
                     return EvaluationResponse(
                         score=None,
                         passed=False,
                         error=error_dict.get("error", str(e)),
-                        metadata={
-                            "provider": "ragas",
-                            "error_type": getattr(e, 'error_type', 'unknown'),
-                            "execution_time_seconds": str(execution_time),
-                            "requested_metrics": ",".join(metrics),
-                            "original_error": error_dict.get("original_error") if error_dict.get("original_error") else None
-                        }
+                        metadata=metadata
                     )
                 else:
                     # Unknown exception, re-raise
@@ -173,7 +290,6 @@ class RagasProvider(OSSEvaluationProvider):
 
                     # Add specific validation errors if any
                     if validation_results.get('validation_errors'):
-                        import json
                         metadata["validation_errors"] = json.dumps(validation_results['validation_errors'])
 
                         # Add information about failed metrics
@@ -191,11 +307,11 @@ class RagasProvider(OSSEvaluationProvider):
                     metadata=metadata
                 )
 
-            overall_score = sum(scores.values()) / len(scores)
-
             # Get threshold
             threshold = float(request.parameters.get("threshold", "0.7")) if request.parameters else 0.7
 
+            overall_score, passed = self._aggregate_scores(scores, threshold)
+
             # Calculate execution time
             execution_time = time.time() - start_time
 
@@ -206,7 +322,7 @@ class RagasProvider(OSSEvaluationProvider):
                 "metrics_evaluated": ",".join(scores.keys()),
                 "metric_count": str(len(scores)),
                 "threshold": str(threshold),
-                "scores": str(scores),
+                "scores": json.dumps(scores),
                 "average_score": f"{overall_score:.2f}",
                 "execution_time_seconds": str(execution_time)
             }
@@ -222,7 +338,6 @@ class RagasProvider(OSSEvaluationProvider):
 
                 # Add specific validation errors if any (as JSON string for structured data)
                 if validation_results.get('validation_errors'):
-                    import json
                     metadata["validation_errors"] = json.dumps(validation_results['validation_errors'])
 
                 # Add information about failed metrics (backward compatible)
@@ -247,9 +362,10 @@ class RagasProvider(OSSEvaluationProvider):
                 except Exception as e:
                     logger.debug(f"Could not get token usage: {e}")
 
-            return EvaluationResponse(
+            # Every field was built above with the declared types, so skip pydantic validation
+            return EvaluationResponse.model_construct(
                 score=str(overall_score),
-                passed=overall_score >= threshold,
+                passed=passed,
                 metadata=metadata,
                 tokenUsage=token_usage
             )
@@ -272,12 +388,64 @@ class RagasProvider(OSSEvaluationProvider):
                 }
             )
 
-    def _get_ragas_adapter(self):
-        """Get or create RAGAS adapter instance."""
-        if self._ragas_adapter is None:
+    def _get_ragas_adapter(self, parameters: Dict[str, Any]):
+        """
+        Get or create the RAGAS adapter for the connection config in parameters.
+
+        Args:
+            parameters: Request parameters carrying the Azure or OpenAI configuration
+
+        Returns:
+            RAGAS adapter shared by all requests with the same connection config
+        """
+        key = self._adapter_cache_key(parameters)
+        adapter = self._adapter_cache.get(key)
+        if adapter is None:
             from .ragas_adapter_refactored import RagasAdapter
-            self._ragas_adapter = RagasAdapter()
-        return self._ragas_adapter
+            adapter = RagasAdapter()
+            self._adapter_cache[key] = adapter
+            self._register_cleanup(adapter.aclose)
+        return adapter
+
+    async def aclose(self) -> None:
+        """Close the HTTP connection pools held by the cached adapters."""
+        await self._cleanup()
+
+    def _adapter_cache_key(self, parameters: Dict[str, Any]) -> tuple:
+        """
+        Build the adapter cache key from the client config the adapter would build.
+
+        Uses the same provider detection as the adapter, so every parameter that
+        selects the endpoint, credentials or model is part of the key.
+
+        Args:
+            parameters: Request parameters
+
+        Returns:
+            Tuple of the provider type, its sorted LLM config and the embedding deployment
+        """
+        provider_type, llm_config = self._llm_provider.detect_provider(parameters)
+        # Azure embeddings read these after azure.* is normalized to langfuse.azure_*
+        embedding_config = tuple(
+            (name, str(parameters.get(f"langfuse.azure_{name}", parameters.get(f"azure.{name}"))))
+            for name in ("embedding_deployment", "embedding_model")
+        )
+        config = tuple(sorted((name, str(value)) for name, value in llm_config.items()))
+        return (provider_type,) + config + embedding_config
+
+    def _aggregate_scores(self, scores: Dict[str, float], threshold: float) -> Tuple[float, bool]:
+        """
+        Average metric scores and compare the average against the threshold.
+
+        Args:
+            scores: Metric scores keyed by metric name
+            threshold: Minimum average score to pass
+
+        Returns:
+            Tuple of (average score, passed)
+        """
+        overall_score = fmean(scores.values())
+        return overall_score, overall_score >= threshold
 
     def _parse_metrics(self, metrics_str: str) -> List[str]:
         """
@@ -293,9 +461,8 @@ class RagasProvider(OSSEvaluationProvider):
             # Default metrics
             return ["relevance", "correctness"]
 
-        # Split and clean metrics
-        metrics = [metric.strip() for metric in metrics_str.split(",")]
-        return [metric for metric in metrics if metric]  # Remove empty strings
+        # Split and clean metrics; copy the cached tuple so callers get their own list
+        return list(_split_metrics(metrics_str))
 
     def _parse_connection_config(self, parameters: Dict[str, Any], prefix: str) -> Dict[str, Any]:
         """
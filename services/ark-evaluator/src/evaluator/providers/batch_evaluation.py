@@ -20,7 +20,7 @@ class BatchEvaluationProvider(EvaluationProvider):
         """
         Execute batch evaluation by aggregating multiple evaluation results.
         """
-        logger.info(f"Processing batch evaluation with evaluator: {request.evaluator_name}")
+        logger.info("Processing batch evaluation with evaluator: %s", request.evaluatorName)
         
         # TODO: Implement batch evaluation logic
         # This would involve:
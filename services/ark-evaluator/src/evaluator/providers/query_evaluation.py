@@ -1,5 +1,6 @@
 from fastapi import HTTPException
 import logging
+from typing import Optional, Tuple
 from kubernetes import client, config
 from kubernetes.client.rest import ApiException
 
@@ -22,11 +23,64 @@ class QueryEvaluationProvider(EvaluationProvider):
     def get_evaluation_type(self) -> str:
         return "query"
     
+    def _extract_query_data(self, query_resource: dict, response_target: Optional[str]) -> Tuple[str, Optional[str], str]:
+        """
+        Extract input, first agent target name and response output from a Query resource in a single pass.
+        """
+        spec = query_resource.get("spec") or {}
+        input_text = spec.get("input") or ""
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("ARK-EVALUATOR: Extracted input: %s...", input_text[:100])
+        
+        # Extract actual agent name from query targets for agent context resolution
+        actual_agent_name = None
+        for target in spec.get("targets") or ():
+            if target.get("type") == "agent":
+                actual_agent_name = target.get("name")
+                logger.info("ARK-EVALUATOR: Found agent target: %s", actual_agent_name)
+                break
+        
+        output_text = ""
+        responses = (query_resource.get("status") or {}).get("responses")
+        if responses:
+            if response_target:
+                # Parse response_target format (could be "name" or "type:name")
+                if ":" in response_target:
+                    target_type, target_name = response_target.split(":", 1)
+                else:
+                    # Legacy format: just the name
+                    target_type, target_name = None, response_target
+                
+                match = None
+                for response in responses:
+                    target = response.get("target") or {}
+                    if target.get("name") == target_name and (target_type is None or target.get("type") == target_type):
+                        match = response
+                        break
+                
+                if match is not None:
+                    output_text = match.get("content") or ""
+                    logger.debug("ARK-EVALUATOR: Found response from target %s", response_target)
+                else:
+                    logger.warning("ARK-EVALUATOR: No response found from target %s", response_target)
+                    if logger.isEnabledFor(logging.DEBUG):
+                        available_targets = [r.get("target", {}).get("name") for r in responses]
+                        logger.debug("ARK-EVALUATOR: Available response targets: %s", available_targets)
+            else:
+                # Use first response if no specific target
+                output_text = responses[0].get("content") or ""
+                logger.debug("ARK-EVALUATOR: Using first response (no specific target)")
+        
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("ARK-EVALUATOR: Extracted output: %s...", output_text[:100])
+        
+        return input_text, actual_agent_name, output_text
+    
     async def evaluate(self, request: UnifiedEvaluationRequest) -> EvaluationResponse:
         """
         Execute query-based evaluation by resolving query data and evaluating results.
         """
-        logger.info(f"Processing query evaluation with evaluator: {request.evaluatorName}")
+        logger.info("Processing query evaluation with evaluator: %s", request.evaluatorName)
         
         # Validate query evaluation requirements
         if not request.config or not hasattr(request.config, 'queryRef'):
@@ -38,27 +92,31 @@ class QueryEvaluationProvider(EvaluationProvider):
         query_namespace = query_ref.namespace
         response_target = query_ref.responseTarget
         
-        logger.info(f"ark-evaluator: Received queryRef: name={query_name}, namespace={query_namespace}, responseTarget={response_target}")
+        logger.info("ark-evaluator: Received queryRef: name=%s, namespace=%s, responseTarget=%s", query_name, query_namespace, response_target)
         
         if not query_namespace:
-            logger.warning(f"QueryRef namespace is empty for query {query_name}, this may cause query resolution to fail")
+            logger.warning("QueryRef namespace is empty for query %s, this may cause query resolution to fail", query_name)
             query_namespace = "default"
-            logger.debug(f"ARK-EVALUATOR: Defaulting to namespace: {query_namespace}")
+            logger.debug("ARK-EVALUATOR: Defaulting to namespace: %s", query_namespace)
         
+        # Initialize Kubernetes client
         try:
-            # Initialize Kubernetes client
+            config.load_incluster_config()
+        except config.ConfigException:
             try:
-                config.load_incluster_config()
-            except config.ConfigException:
                 config.load_kube_config()
-            
-            # Create API client for custom resources
-            api_client = client.ApiClient()
-            custom_api = client.CustomObjectsApi(api_client)
-            
-            # Fetch the Query resource
-            logger.debug(f"ARK-EVALUATOR: Fetching query {query_name} from namespace {query_namespace}")
-            
+            except config.ConfigException as e:
+                logger.error("ARK-EVALUATOR: Could not load Kubernetes configuration: %s", e)
+                raise HTTPException(status_code=500, detail=f"Failed to load Kubernetes configuration: {e}")
+        
+        # Create API client for custom resources
+        api_client = client.ApiClient()
+        custom_api = client.CustomObjectsApi(api_client)
+        
+        # Fetch the Query resource
+        logger.debug("ARK-EVALUATOR: Fetching query %s from namespace %s", query_name, query_namespace)
+        
+        try:
             query_resource = custom_api.get_namespaced_custom_object(
                 group="ark.mckinsey.com",
                 version="v1alpha1",
@@ -66,56 +124,13 @@ class QueryEvaluationProvider(EvaluationProvider):
                 plural="queries",
                 name=query_name
             )
-            
-            logger.debug(f"ARK-EVALUATOR: Successfully fetched query {query_name}")
-            
-            # Extract input and output
-            input_text = query_resource["spec"].get("input", "")
-            logger.debug(f"ARK-EVALUATOR: Extracted input: {input_text[:100]}...")
-            
-            # Extract actual agent name from query targets for agent context resolution
-            actual_agent_name = None
-            if query_resource.get("spec", {}).get("targets"):
-                targets = query_resource["spec"]["targets"]
-                agent_targets = [t for t in targets if t.get("type") == "agent"]
-                if agent_targets:
-                    actual_agent_name = agent_targets[0].get("name")
-                    logger.info(f"ARK-EVALUATOR: Found agent target: {actual_agent_name}")
-            
-            output_text = ""
-            if query_resource.get("status", {}).get("responses"):
-                responses = query_resource["status"]["responses"]
-                if response_target:
-                    # Parse response_target format (could be "name" or "type:name")
-                    if ":" in response_target:
-                        target_type, target_name = response_target.split(":", 1)
-                        # Find response from specific target matching both type and name
-                        target_responses = [r for r in responses 
-                                          if r.get("target", {}).get("type") == target_type 
-                                          and r.get("target", {}).get("name") == target_name]
-                    else:
-                        # Legacy format: just the name
-                        target_responses = [r for r in responses if r.get("target", {}).get("name") == response_target]
-                    if target_responses:
-                        output_text = target_responses[0].get("content", "")
-                        logger.debug(f"ARK-EVALUATOR: Found response from target {response_target}")
-                    else:
-                        logger.warning(f"ARK-EVALUATOR: No response found from target {response_target}")
-                        available_targets = [r.get("target", {}).get("name") for r in responses]
-                        logger.debug(f"ARK-EVALUATOR: Available response targets: {available_targets}")
-                else:
-                    # Use first response if no specific target
-                    output_text = responses[0].get("content", "")
-                    logger.debug(f"ARK-EVALUATOR: Using first response (no specific target)")
-            
-            logger.debug(f"ARK-EVALUATOR: Extracted output: {output_text[:100]}...")
-            
         except ApiException as e:
-            logger.error(f"ARK-EVALUATOR: Kubernetes API error: {e}")
+            logger.error("ARK-EVALUATOR: Kubernetes API error: %s", e)
             raise HTTPException(status_code=500, detail=f"Failed to fetch query {query_name}: {e}")
-        except Exception as e:
-            logger.error(f"ARK-EVALUATOR: Unexpected error fetching query: {e}")
-            raise HTTPException(status_code=500, detail=f"Failed to process query {query_name}: {e}")
+        
+        logger.debug("ARK-EVALUATOR: Successfully fetched query %s", query_name)
+        
+        input_text, actual_agent_name, output_text = self._extract_query_data(query_resource, response_target)
         
         # Extract model reference from parameters
         model_ref = self._extract_model_ref(request.parameters)
@@ -124,13 +139,13 @@ class QueryEvaluationProvider(EvaluationProvider):
         
         # Create evaluation request with proper agent name for context resolution
         target_name = response_target or actual_agent_name or "query-response"
-        logger.info(f"ARK-EVALUATOR: Using target name for evaluation: {target_name}")
+        logger.info("ARK-EVALUATOR: Using target name for evaluation: %s", target_name)
         
-        eval_request = EvaluationRequest(
+        eval_request = EvaluationRequest.model_construct(
             queryId=f"query-evaluation-{query_name}",
             input=input_text,
-            responses=[Response(
-                target=QueryTarget(type="agent", name=target_name),
+            responses=[Response.model_construct(
+                target=QueryTarget.model_construct(type="agent", name=target_name),
                 content=output_text
             )],
             query={"metadata": {"name": query_name, "namespace": query_namespace}, "spec": {"input": input_text}},
@@ -157,5 +172,5 @@ class QueryEvaluationProvider(EvaluationProvider):
         if response_target:
             result.metadata["query.responseTarget"] = response_target
         
-        logger.info(f"Query evaluation completed: score={result.score}, passed={result.passed}")
+        logger.info("Query evaluation completed: score=%s, passed=%s", result.score, result.passed)
         return result
\ No newline at end of file
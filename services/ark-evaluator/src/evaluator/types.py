@@ -1,15 +1,17 @@
 from typing import Dict, List, Any, Optional, Union, Literal
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from enum import Enum
 import logging
 
 logger = logging.getLogger(__name__)
 
 class QueryTarget(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
     type: str
     name: str
 
 class Response(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
     target: QueryTarget
     content: str
 
@@ -24,6 +26,7 @@ class ModelRef(BaseModel):
     namespace: Optional[str] = None
 
 class EvaluationRequest(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
     queryId: str
     input: str
     responses: List[Response]
@@ -55,6 +58,8 @@ class EvaluationScope(str, Enum):
     FAITHFULNESS = "faithfulness"
 
 class EvaluationParameters(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+    
     scope: Optional[str] = Field(default="all", description="Evaluation scope")
     min_score: float = Field(default=0.7, ge=0.0, le=1.0, description="Minimum score threshold")
     
@@ -5,13 +5,8 @@ Testing common functionality and utilities that can be shared across providers.
 
 import pytest
 from unittest.mock import Mock, AsyncMock, patch
-import sys
-from pathlib import Path
 from typing import Dict, Any
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
-
 
 class TestOSSEvaluationProviderBase:
     """Test suite for enhanced OSSEvaluationProvider base class utilities."""
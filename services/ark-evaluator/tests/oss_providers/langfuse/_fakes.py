@@ -0,0 +1,65 @@
+"""
+Lightweight stand-ins for the Langfuse SDK objects used by the adapter tests.
+They record calls in plain lists and counters instead of unittest.mock trees.
+"""
+
+from typing import Any, Dict, List, Optional
+
+
+class FakeGeneration:
+    """Generation span that counts end() calls."""
+
+    __slots__ = ("end_calls",)
+
+    def __init__(self):
+        self.end_calls = 0
+
+    def end(self, **kwargs):
+        self.end_calls += 1
+
+
+class FakeTrace:
+    """Trace that records generation, score and update calls."""
+
+    __slots__ = ("id", "generations", "score_calls", "update_calls")
+
+    def __init__(self, trace_id: str = "test-trace-id"):
+        self.id = trace_id
+        self.generations: List[FakeGeneration] = []
+        self.score_calls: List[Dict[str, Any]] = []
+        self.update_calls: List[Dict[str, Any]] = []
+
+    def generation(self, **kwargs) -> FakeGeneration:
+        generation = FakeGeneration()
+        self.generations.append(generation)
+        return generation
+
+    def score(self, **kwargs):
+        self.score_calls.append(kwargs)
+
+    def update(self, **kwargs):
+        self.update_calls.append(kwargs)
+
+
+class FakeLangfuseClient:
+    """Langfuse client that hands out FakeTrace objects and counts flushes."""
+
+    __slots__ = ("trace_id", "trace_error", "trace_calls", "traces", "flush_calls")
+
+    def __init__(self, trace_id: str = "test-trace-id", trace_error: Optional[Exception] = None):
+        self.trace_id = trace_id
+        self.trace_error = trace_error
+        self.trace_calls: List[Dict[str, Any]] = []
+        self.traces: List[FakeTrace] = []
+        self.flush_calls = 0
+
+    def trace(self, **kwargs) -> FakeTrace:
+        self.trace_calls.append(kwargs)
+        if self.trace_error is not None:
+            raise self.trace_error
+        trace = FakeTrace(self.trace_id)
+        self.traces.append(trace)
+        return trace
+
+    def flush(self):
+        self.flush_calls += 1
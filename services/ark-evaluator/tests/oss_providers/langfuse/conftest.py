@@ -0,0 +1,48 @@
+"""
+Test configuration for Langfuse adapter tests.
+"""
+
+from types import MappingProxyType
+from typing import Any, Mapping
+
+import pytest
+
+from ._fakes import FakeLangfuseClient
+
+
+SAMPLE_PARAMS: Mapping[str, Any] = MappingProxyType({
+    "langfuse.host": "https://cloud.langfuse.com",
+    "langfuse.public_key": "test-public-key",
+    "langfuse.secret_key": "test-secret-key"
+})
+
+SAMPLE_SCORES: Mapping[str, float] = MappingProxyType({
+    "relevance": 0.85,
+    "correctness": 0.92,
+    "toxicity": 0.1,  # Lower is better for toxicity
+    "helpfulness": 0.78
+})
+
+
+@pytest.fixture
+def fake_langfuse_client():
+    """Create a fake Langfuse client."""
+    return FakeLangfuseClient()
+
+
+@pytest.fixture(scope="session")
+def sample_params() -> Mapping[str, Any]:
+    """Sample parameters for Langfuse configuration."""
+    return SAMPLE_PARAMS
+
+
+@pytest.fixture(scope="session")
+def sample_scores() -> Mapping[str, float]:
+    """Sample evaluation scores from external source."""
+    return SAMPLE_SCORES
+
+
+@pytest.fixture
+def no_autoflush(monkeypatch):
+    """Skip the per-call Langfuse client flush for tests that do not assert on it."""
+    monkeypatch.setenv("LANGFUSE_DISABLE_AUTOFLUSH", "1")
@@ -6,50 +6,19 @@ Note: Langfuse Python SDK does NOT provide built-in LLM-as-a-Judge evaluators.
 This adapter focuses on tracing and score recording only.
 """
 
+import asyncio
 import pytest
-from unittest.mock import Mock, AsyncMock, patch, MagicMock
-import sys
-from pathlib import Path
-from typing import Dict, Any
+from unittest.mock import Mock, AsyncMock, patch
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+from evaluator.oss_providers.langfuse import langfuse_trace_adapter
+from evaluator.oss_providers.langfuse.langfuse_adapter import LangfuseAdapter
 
 
 class TestLangfuseTraceAdapter:
     """Test suite for LangfuseTraceAdapter focusing on tracing and score recording."""
 
-    @pytest.fixture
-    def mock_langfuse_client(self):
-        """Create a mock Langfuse client."""
-        client = Mock()
-        client.score = Mock()
-        client.flush = Mock()
-        return client
-
-    @pytest.fixture
-    def sample_params(self) -> Dict[str, Any]:
-        """Sample parameters for Langfuse configuration."""
-        return {
-            "langfuse.host": "https://cloud.langfuse.com",
-            "langfuse.public_key": "test-public-key",
-            "langfuse.secret_key": "test-secret-key"
-        }
-
-    @pytest.fixture
-    def sample_scores(self) -> Dict[str, float]:
-        """Sample evaluation scores from external source."""
-        return {
-            "relevance": 0.85,
-            "correctness": 0.92,
-            "toxicity": 0.1,  # Lower is better for toxicity
-            "helpfulness": 0.78
-        }
-
     def test_adapter_initialization(self):
         """Test LangfuseAdapter can be initialized with optional parameters."""
-        from evaluator.oss_providers.langfuse.langfuse_adapter import LangfuseAdapter
-
         # Test default initialization
         adapter = LangfuseAdapter()
         assert adapter is not None
@@ -61,26 +30,14 @@ class TestLangfuseTraceAdapter:
 
     def test_adapter_initialization_with_client(self):
         """Test LangfuseAdapter can be initialized with existing client."""
-        from evaluator.oss_providers.langfuse.langfuse_adapter import LangfuseAdapter
-
         mock_client = Mock()
         adapter = LangfuseAdapter(langfuse_client=mock_client)
         assert adapter._client == mock_client
 
     @pytest.mark.asyncio
-    async def test_trace_creation_and_score_recording(self, mock_langfuse_client, sample_params, sample_scores):
+    async def test_trace_creation_and_score_recording(self, fake_langfuse_client, sample_params, sample_scores):
         """Test trace creation and recording external evaluation scores."""
-        from evaluator.oss_providers.langfuse.langfuse_adapter import LangfuseAdapter
-
-        adapter = LangfuseAdapter(langfuse_client=mock_langfuse_client)
-
-        # Mock trace object
-        mock_trace = Mock()
-        mock_trace.generation = Mock(return_value=Mock(end=Mock()))
-        mock_trace.score = Mock()
-        mock_trace.update = Mock()
-        mock_trace.id = "test-trace-id"
-        mock_langfuse_client.trace.return_value = mock_trace
+        adapter = LangfuseAdapter(langfuse_client=fake_langfuse_client)
 
         result = await adapter.record_evaluation_trace(
             input_text="What is the capital of France?",
@@ -91,29 +48,49 @@ class TestLangfuseTraceAdapter:
         )
 
         # Verify trace was created
-        mock_langfuse_client.trace.assert_called_once()
-        trace_call = mock_langfuse_client.trace.call_args[1]
+        assert len(fake_langfuse_client.trace_calls) == 1
+        trace_call = fake_langfuse_client.trace_calls[0]
         assert "What is the capital of France?" in trace_call["input"]
         assert "The capital of France is Paris." in trace_call["output"]
 
         # Verify scores were recorded
-        assert mock_trace.score.call_count == len(sample_scores)
+        trace = fake_langfuse_client.traces[0]
+        assert len(trace.score_calls) == len(sample_scores)
 
         # Verify trace was updated with metadata
-        mock_trace.update.assert_called_once()
+        assert len(trace.update_calls) == 1
 
-        # Verify client was flushed
-        mock_langfuse_client.flush.assert_called_once()
+        # Verify client was flushed in the background
+        assert len(adapter._pending_flushes) == 1
+        await asyncio.gather(*adapter._pending_flushes)
+        assert fake_langfuse_client.flush_calls == 1
 
         # Return value should contain trace info
         assert result["trace_id"] == "test-trace-id"
         assert result["scores_recorded"] == len(sample_scores)
 
     @pytest.mark.asyncio
+    async def test_record_evaluation_trace_skipped_when_disabled(self, sample_params, sample_scores):
+        """Test that disabled tracing returns immediately without touching the client."""
+        adapter = LangfuseAdapter(create_traces=False)
+
+        with patch.object(adapter, '_get_langfuse_client') as mock_get_client:
+            result = await adapter.record_evaluation_trace(
+                input_text="Test input",
+                output_text="Test output",
+                scores=sample_scores,
+                params=sample_params
+            )
+
+        mock_get_client.assert_not_called()
+        assert result["trace_id"] is None
+        assert result["scores_recorded"] == 0
+        assert result.status == "disabled"
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("no_autoflush")
     async def test_score_calculation_and_aggregation(self, sample_params):
         """Test that scores are properly calculated and aggregated."""
-        from evaluator.oss_providers.langfuse.langfuse_adapter import LangfuseAdapter
-
         adapter = LangfuseAdapter(create_traces=False)
 
         # Mock evaluator with different scores
@@ -144,8 +121,6 @@ class TestLangfuseTraceAdapter:
     @pytest.mark.asyncio
     async def test_missing_langfuse_library_handling(self, sample_params):
         """Test graceful handling when Langfuse library is not installed."""
-        from evaluator.oss_providers.langfuse.langfuse_adapter import LangfuseAdapter
-
         adapter = LangfuseAdapter()
 
         # Mock the import to raise ImportError
@@ -166,8 +141,6 @@ class TestLangfuseTraceAdapter:
 
     def test_parameter_validation(self, sample_params):
         """Test that required parameters are validated."""
-        from evaluator.oss_providers.langfuse.langfuse_adapter import LangfuseAdapter
-
         adapter = LangfuseAdapter()
 
         # Test with valid params
@@ -182,12 +155,11 @@ class TestLangfuseTraceAdapter:
         assert adapter.validate_params(None) is False
 
     @pytest.mark.asyncio
-    async def test_trace_creation_optional(self, mock_langfuse_client, sample_params):
+    @pytest.mark.usefixtures("no_autoflush")
+    async def test_trace_creation_optional(self, fake_langfuse_client, sample_params):
         """Test that trace creation can be disabled."""
-        from evaluator.oss_providers.langfuse.langfuse_adapter import LangfuseAdapter
-
         # Test with traces disabled
-        adapter_no_traces = LangfuseAdapter(create_traces=False, langfuse_client=mock_langfuse_client)
+        adapter_no_traces = LangfuseAdapter(create_traces=False, langfuse_client=fake_langfuse_client)
 
         mock_evaluator = AsyncMock(evaluate=AsyncMock(return_value={"score": 0.75}))
         with patch.object(adapter_no_traces, '_get_evaluator', return_value=mock_evaluator):
@@ -199,18 +171,11 @@ class TestLangfuseTraceAdapter:
             )
 
             # Should not create trace
-            mock_langfuse_client.trace.assert_not_called()
+            assert fake_langfuse_client.trace_calls == []
             assert scores["relevance"] == 0.75
 
         # Test with traces enabled (default)
-        mock_langfuse_client.reset_mock()  # Reset mock for next test
-        adapter_with_traces = LangfuseAdapter(create_traces=True, langfuse_client=mock_langfuse_client)
-        mock_langfuse_client.trace.return_value = Mock(
-            generation=Mock(return_value=Mock(end=Mock())),
-            score=Mock(),
-            update=Mock(),
-            id="test-trace-id"
-        )
+        adapter_with_traces = LangfuseAdapter(create_traces=True, langfuse_client=fake_langfuse_client)
 
         with patch.object(adapter_with_traces, '_get_evaluator', return_value=mock_evaluator):
             scores = await adapter_with_traces.evaluate(
@@ -221,13 +186,12 @@ class TestLangfuseTraceAdapter:
             )
 
             # Should create trace
-            mock_langfuse_client.trace.assert_called_once()
+            assert len(fake_langfuse_client.trace_calls) == 1
 
     @pytest.mark.asyncio
+    @pytest.mark.usefixtures("no_autoflush")
     async def test_custom_evaluator_support(self, sample_params):
         """Test support for custom Langfuse evaluators."""
-        from evaluator.oss_providers.langfuse.langfuse_adapter import LangfuseAdapter
-
         adapter = LangfuseAdapter()
 
         # Mock custom evaluator
@@ -250,10 +214,9 @@ class TestLangfuseTraceAdapter:
                 assert scores["custom_evaluator_v1"] == 0.95
 
     @pytest.mark.asyncio
+    @pytest.mark.usefixtures("no_autoflush")
     async def test_error_handling_in_evaluation(self, sample_params):
         """Test error handling when evaluation fails."""
-        from evaluator.oss_providers.langfuse.langfuse_adapter import LangfuseAdapter
-
         adapter = LangfuseAdapter()
 
         # Mock evaluator that raises an error
@@ -273,10 +236,35 @@ class TestLangfuseTraceAdapter:
                 assert "Evaluation failed" in str(exc_info.value)
 
     @pytest.mark.asyncio
+    @pytest.mark.usefixtures("no_autoflush")
+    async def test_failed_evaluator_keeps_other_scores(self, fake_langfuse_client, sample_params, caplog):
+        """Test that one failing evaluator is logged and the other scores are still recorded."""
+        adapter = LangfuseAdapter(langfuse_client=fake_langfuse_client)
+
+        mock_evaluators = {
+            "relevance": AsyncMock(evaluate=AsyncMock(return_value={"score": 0.9})),
+            "toxicity": AsyncMock(evaluate=AsyncMock(side_effect=Exception("Evaluation failed"))),
+            "helpfulness": AsyncMock(evaluate=AsyncMock(return_value={"score": 0.8}))
+        }
+
+        with patch.object(adapter, '_get_evaluator', side_effect=lambda name, _: mock_evaluators[name]):
+            with pytest.raises(Exception, match="Evaluation failed"):
+                await adapter.evaluate(
+                    input_text="Test input",
+                    output_text="Test output",
+                    evaluators=["relevance", "toxicity", "helpfulness"],
+                    params=sample_params
+                )
+
+        trace = fake_langfuse_client.traces[0]
+        assert [call["name"] for call in trace.score_calls] == ["relevance", "helpfulness"]
+        assert trace.update_calls[-1]["metadata"]["scores"] == {"relevance": 0.9, "helpfulness": 0.8}
+        assert "Langfuse evaluator toxicity failed: Evaluation failed" in caplog.text
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("no_autoflush")
     async def test_evaluator_configuration(self, sample_params):
         """Test that evaluators can be configured with custom settings."""
-        from evaluator.oss_providers.langfuse.langfuse_adapter import LangfuseAdapter
-
         adapter = LangfuseAdapter()
 
         # Add custom evaluator configuration
@@ -310,4 +298,57 @@ class TestLangfuseTraceAdapter:
                 mock_get_evaluator.assert_called_with(
                     "relevance",
                     {"threshold": 0.7, "model": "gpt-4"}
-                )
\ No newline at end of file
+                )
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("no_autoflush")
+    async def test_evaluators_run_concurrently(self, sample_params):
+        """Test that evaluators are awaited concurrently and bounded by max_concurrency."""
+        async def run_with_limit(max_concurrency):
+            adapter = LangfuseAdapter(create_traces=False, max_concurrency=max_concurrency)
+            in_flight = 0
+            peak = 0
+
+            async def evaluate(data):
+                nonlocal in_flight, peak
+                in_flight += 1
+                peak = max(peak, in_flight)
+                await asyncio.sleep(0)
+                in_flight -= 1
+                return {"score": 0.5}
+
+            with patch.object(adapter, '_get_evaluator', return_value=Mock(evaluate=evaluate)):
+                with patch.object(adapter, '_get_langfuse_client', return_value=Mock()):
+                    scores = await adapter.evaluate(
+                        input_text="Test",
+                        output_text="Response",
+                        evaluators=["relevance", "toxicity", "helpfulness"],
+                        params=sample_params
+                    )
+
+            assert list(scores) == ["relevance", "toxicity", "helpfulness"]
+            return peak
+
+        assert await run_with_limit(None) == 3
+        assert await run_with_limit(1) == 1
+
+    def test_langfuse_client_and_evaluators_are_cached(self, sample_params):
+        """Test that clients are shared per connection and evaluators per name/config."""
+        with patch.dict(langfuse_trace_adapter._langfuse_client_cache, clear=True):
+            with patch("langfuse.Langfuse") as mock_langfuse_class:
+                first = LangfuseAdapter()._get_langfuse_client(sample_params)
+                second = LangfuseAdapter()._get_langfuse_client(sample_params)
+                other = LangfuseAdapter()._get_langfuse_client({**sample_params, "langfuse.public_key": "other-key"})
+
+        assert first is second
+        assert mock_langfuse_class.call_count == 2
+        assert other is mock_langfuse_class.return_value
+
+        adapter = LangfuseAdapter()
+        with patch.object(adapter, '_create_evaluator', side_effect=lambda name, config: Mock()) as mock_create:
+            relevance = adapter._get_evaluator("relevance", {"threshold": 0.7, "model": "gpt-4"})
+            assert adapter._get_evaluator("relevance", {"model": "gpt-4", "threshold": 0.7}) is relevance
+            assert adapter._get_evaluator("relevance", {"threshold": 0.8}) is not relevance
+            assert adapter._get_evaluator("relevance", {"tags": ["a"]}) is adapter._get_evaluator("relevance", {"tags": ["a"]})
+
+        assert mock_create.call_count == 3
@@ -6,50 +6,22 @@ Note: Langfuse Python SDK does NOT provide built-in LLM-as-a-Judge evaluators.
 This adapter focuses on tracing and score recording only.
 """
 
+import asyncio
+import threading
 import pytest
-from unittest.mock import Mock, AsyncMock, patch, MagicMock
-import sys
-from pathlib import Path
-from typing import Dict, Any
+from unittest.mock import Mock, patch
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+from evaluator.oss_providers.langfuse import langfuse_trace_adapter
+from evaluator.oss_providers.langfuse.langfuse_trace_adapter import LangfuseTraceAdapter
+
+from ._fakes import FakeLangfuseClient, FakeTrace
 
 
 class TestLangfuseTraceAdapter:
     """Test suite for LangfuseTraceAdapter focusing on tracing and score recording."""
 
-    @pytest.fixture
-    def mock_langfuse_client(self):
-        """Create a mock Langfuse client."""
-        client = Mock()
-        client.score = Mock()
-        client.flush = Mock()
-        return client
-
-    @pytest.fixture
-    def sample_params(self) -> Dict[str, Any]:
-        """Sample parameters for Langfuse configuration."""
-        return {
-            "langfuse.host": "https://cloud.langfuse.com",
-            "langfuse.public_key": "test-public-key",
-            "langfuse.secret_key": "test-secret-key"
-        }
-
-    @pytest.fixture
-    def sample_scores(self) -> Dict[str, float]:
-        """Sample evaluation scores from external source."""
-        return {
-            "relevance": 0.85,
-            "correctness": 0.92,
-            "toxicity": 0.1,  # Lower is better for toxicity
-            "helpfulness": 0.78
-        }
-
     def test_adapter_initialization(self):
         """Test LangfuseTraceAdapter can be initialized with optional parameters."""
-        from evaluator.oss_providers.langfuse.langfuse_trace_adapter import LangfuseTraceAdapter
-
         # Test default initialization
         adapter = LangfuseTraceAdapter()
         assert adapter is not None
@@ -61,26 +33,14 @@ class TestLangfuseTraceAdapter:
 
     def test_adapter_initialization_with_client(self):
         """Test LangfuseTraceAdapter can be initialized with existing client."""
-        from evaluator.oss_providers.langfuse.langfuse_trace_adapter import LangfuseTraceAdapter
-
         mock_client = Mock()
         adapter = LangfuseTraceAdapter(langfuse_client=mock_client)
         assert adapter._client == mock_client
 
     @pytest.mark.asyncio
-    async def test_trace_creation_and_score_recording(self, mock_langfuse_client, sample_params, sample_scores):
+    async def test_trace_creation_and_score_recording(self, fake_langfuse_client, sample_params, sample_scores):
         """Test trace creation and recording external evaluation scores."""
-        from evaluator.oss_providers.langfuse.langfuse_trace_adapter import LangfuseTraceAdapter
-
-        adapter = LangfuseTraceAdapter(langfuse_client=mock_langfuse_client)
-
-        # Mock trace object
-        mock_trace = Mock()
-        mock_trace.generation = Mock(return_value=Mock(end=Mock()))
-        mock_trace.score = Mock()
-        mock_trace.update = Mock()
-        mock_trace.id = "test-trace-id"
-        mock_langfuse_client.trace.return_value = mock_trace
+        adapter = LangfuseTraceAdapter(langfuse_client=fake_langfuse_client)
 
         result = await adapter.record_evaluation_trace(
             input_text="What is the capital of France?",
@@ -91,31 +51,109 @@ class TestLangfuseTraceAdapter:
         )
 
         # Verify trace was created
-        mock_langfuse_client.trace.assert_called_once()
-        trace_call = mock_langfuse_client.trace.call_args[1]
+        assert len(fake_langfuse_client.trace_calls) == 1
+        trace_call = fake_langfuse_client.trace_calls[0]
         assert "What is the capital of France?" in trace_call["input"]
         assert "The capital of France is Paris." in trace_call["output"]
-
-        # Verify scores were recorded
-        assert mock_trace.score.call_count == len(sample_scores)
-
-        # Verify trace was updated with metadata (called twice: once in record_scores_to_trace, once at end)
-        assert mock_trace.update.call_count == 2
-
-        # Verify client was flushed
-        mock_langfuse_client.flush.assert_called_once()
+        assert "metadata" not in trace_call
+
+        # Verify each score was recorded
+        trace = fake_langfuse_client.traces[0]
+        assert len(trace.score_calls) == len(sample_scores)
+        assert all(call["data_type"] == "NUMERIC" for call in trace.score_calls)
+
+        # Verify trace was updated once with the merged metadata
+        assert len(trace.update_calls) == 1
+        update_metadata = trace.update_calls[0]["metadata"]
+        assert update_metadata["evaluator"] == "ragas"
+        assert update_metadata["scores_recorded"] == len(sample_scores)
+        assert update_metadata["total_scores"] == len(sample_scores)
+        assert "average_score" in update_metadata
+
+        # Verify client was flushed in the background
+        assert len(adapter._pending_flushes) == 1
+        await asyncio.gather(*adapter._pending_flushes)
+        assert fake_langfuse_client.flush_calls == 1
 
         # Return value should contain trace info
         assert result["trace_id"] == "test-trace-id"
         assert result["scores_recorded"] == len(sample_scores)
 
     @pytest.mark.asyncio
-    async def test_trace_creation_can_be_disabled(self, mock_langfuse_client, sample_params, sample_scores):
-        """Test that trace creation can be disabled while still recording scores."""
-        from evaluator.oss_providers.langfuse.langfuse_trace_adapter import LangfuseTraceAdapter
+    async def test_enforced_flush_is_awaited(self, fake_langfuse_client, sample_params, sample_scores, monkeypatch):
+        """Test that LANGFUSE_ENFORCE_FLUSH=1 waits for the flush before returning."""
+        monkeypatch.setenv("LANGFUSE_ENFORCE_FLUSH", "1")
+        adapter = LangfuseTraceAdapter(langfuse_client=fake_langfuse_client)
+
+        await adapter.record_evaluation_trace(
+            input_text="Test input",
+            output_text="Test output",
+            scores=sample_scores,
+            params=sample_params
+        )
+
+        assert fake_langfuse_client.flush_calls == 1
+        assert not adapter._pending_flushes
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("no_autoflush")
+    async def test_autoflush_can_be_disabled(self, fake_langfuse_client, sample_params, sample_scores):
+        """Test that LANGFUSE_DISABLE_AUTOFLUSH skips the per-call flush until close()."""
+        adapter = LangfuseTraceAdapter(langfuse_client=fake_langfuse_client)
+
+        await adapter.record_evaluation_trace(
+            input_text="Test input",
+            output_text="Test output",
+            scores=sample_scores,
+            params=sample_params
+        )
+
+        assert fake_langfuse_client.flush_calls == 0
+        assert not adapter._pending_flushes
+
+        await adapter.close()
+        assert fake_langfuse_client.flush_calls == 1
+
+    @pytest.mark.asyncio
+    async def test_close_waits_for_every_background_flush(self, sample_params, sample_scores, caplog):
+        """Test that close() waits for all pending flushes and a failed one is logged, not lost."""
+        release = threading.Event()
+
+        class FailingFirstFlushClient(FakeLangfuseClient):
+            __slots__ = ()
+
+            def flush(self):
+                # Hold background flushes until both are pending
+                release.wait()
+                super().flush()
+                if self.flush_calls == 1:
+                    raise RuntimeError("flush rejected")
+
+        client = FailingFirstFlushClient()
+        adapter = LangfuseTraceAdapter(langfuse_client=client)
+
+        for _ in range(2):
+            await adapter.record_evaluation_trace(
+                input_text="Test input",
+                output_text="Test output",
+                scores=sample_scores,
+                params=sample_params
+            )
+        assert len(adapter._pending_flushes) == 2
+
+        release.set()
+        await adapter.close()
 
+        # Both background flushes plus the final one in close()
+        assert client.flush_calls == 3
+        assert not adapter._pending_flushes
+        assert "Background Langfuse flush failed: flush rejected" in caplog.text
+
+    @pytest.mark.asyncio
+    async def test_trace_creation_can_be_disabled(self, fake_langfuse_client, sample_params, sample_scores):
+        """Test that trace creation can be disabled while still recording scores."""
         # Test with traces disabled
-        adapter = LangfuseTraceAdapter(create_traces=False, langfuse_client=mock_langfuse_client)
+        adapter = LangfuseTraceAdapter(create_traces=False, langfuse_client=fake_langfuse_client)
 
         result = await adapter.record_evaluation_trace(
             input_text="Test input",
@@ -125,25 +163,21 @@ class TestLangfuseTraceAdapter:
         )
 
         # Should not create trace when disabled
-        mock_langfuse_client.trace.assert_not_called()
+        assert fake_langfuse_client.trace_calls == []
 
         # But should still return result indicating no trace created
         assert result["trace_id"] is None
         assert result["scores_recorded"] == 0
+        assert result.status == "disabled"
+
+        with pytest.raises(KeyError):
+            result["unknown"]
 
     @pytest.mark.asyncio
-    async def test_score_aggregation_and_metadata(self, mock_langfuse_client, sample_params, sample_scores):
+    @pytest.mark.usefixtures("no_autoflush")
+    async def test_score_aggregation_and_metadata(self, fake_langfuse_client, sample_params, sample_scores):
         """Test that scores are properly aggregated and metadata is included."""
-        from evaluator.oss_providers.langfuse.langfuse_trace_adapter import LangfuseTraceAdapter
-
-        adapter = LangfuseTraceAdapter(langfuse_client=mock_langfuse_client)
-
-        mock_trace = Mock()
-        mock_trace.generation = Mock(return_value=Mock(end=Mock()))
-        mock_trace.score = Mock()
-        mock_trace.update = Mock()
-        mock_trace.id = "test-trace-id"
-        mock_langfuse_client.trace.return_value = mock_trace
+        adapter = LangfuseTraceAdapter(langfuse_client=fake_langfuse_client)
 
         result = await adapter.record_evaluation_trace(
             input_text="Test input",
@@ -154,23 +188,46 @@ class TestLangfuseTraceAdapter:
         )
 
         # Verify individual scores were recorded
-        score_calls = mock_trace.score.call_args_list
-        recorded_metrics = [call[1]["name"] for call in score_calls]
+        trace = fake_langfuse_client.traces[0]
+        recorded_metrics = {score["name"] for score in trace.score_calls}
         assert "relevance" in recorded_metrics
         assert "correctness" in recorded_metrics
         assert "toxicity" in recorded_metrics
         assert "helpfulness" in recorded_metrics
 
         # Verify average score was calculated
-        update_call = mock_trace.update.call_args[1]
+        update_call = trace.update_calls[-1]
         assert "average_score" in update_call["metadata"]
         expected_avg = sum(sample_scores.values()) / len(sample_scores)
-        assert update_call["metadata"]["average_score"] == expected_avg
+        assert update_call["metadata"]["average_score"] == pytest.approx(expected_avg)
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("no_autoflush")
+    async def test_metadata_is_normalized_once_per_trace(self, fake_langfuse_client, sample_params, sample_scores, monkeypatch):
+        """Test that the trace metadata goes through one JSON round-trip, for the final update."""
+        calls = []
+        normalize = langfuse_trace_adapter.normalize_metadata
+
+        def counting_normalize(metadata):
+            calls.append(metadata)
+            return normalize(metadata)
+
+        monkeypatch.setattr(langfuse_trace_adapter, "normalize_metadata", counting_normalize)
+        adapter = LangfuseTraceAdapter(langfuse_client=fake_langfuse_client)
+
+        await adapter.record_evaluation_trace(
+            input_text="Test input",
+            output_text="Test output",
+            scores=sample_scores,
+            params=sample_params,
+            metadata={"evaluator": "ragas"}
+        )
+
+        assert len(calls) == 1
+        assert fake_langfuse_client.traces[0].update_calls[0]["metadata"] == normalize(calls[0])
 
     def test_parameter_validation(self, sample_params):
         """Test that required parameters are validated."""
-        from evaluator.oss_providers.langfuse.langfuse_trace_adapter import LangfuseTraceAdapter
-
         adapter = LangfuseTraceAdapter()
 
         # Test with valid params
@@ -187,8 +244,6 @@ class TestLangfuseTraceAdapter:
     @pytest.mark.asyncio
     async def test_missing_langfuse_library_handling(self, sample_params, sample_scores):
         """Test graceful handling when Langfuse library is not installed."""
-        from evaluator.oss_providers.langfuse.langfuse_trace_adapter import LangfuseTraceAdapter
-
         adapter = LangfuseTraceAdapter()
 
         # Mock the import to raise ImportError
@@ -208,18 +263,11 @@ class TestLangfuseTraceAdapter:
             assert "langfuse" in str(exc_info.value).lower()
 
     @pytest.mark.asyncio
-    async def test_trace_with_custom_session_id(self, mock_langfuse_client, sample_params, sample_scores):
+    @pytest.mark.usefixtures("no_autoflush")
+    async def test_trace_with_custom_session_id(self, fake_langfuse_client, sample_params, sample_scores):
         """Test trace creation with custom session ID."""
-        from evaluator.oss_providers.langfuse.langfuse_trace_adapter import LangfuseTraceAdapter
-
-        adapter = LangfuseTraceAdapter(langfuse_client=mock_langfuse_client)
-
-        mock_trace = Mock()
-        mock_trace.generation = Mock(return_value=Mock(end=Mock()))
-        mock_trace.score = Mock()
-        mock_trace.update = Mock()
-        mock_trace.id = "custom-trace-id"
-        mock_langfuse_client.trace.return_value = mock_trace
+        fake_langfuse_client.trace_id = "custom-trace-id"
+        adapter = LangfuseTraceAdapter(langfuse_client=fake_langfuse_client)
 
         session_id = "evaluation-session-123"
         result = await adapter.record_evaluation_trace(
@@ -231,18 +279,17 @@ class TestLangfuseTraceAdapter:
         )
 
         # Verify session ID was included in trace metadata
-        trace_call = mock_langfuse_client.trace.call_args[1]
+        trace_call = fake_langfuse_client.trace_calls[0]
         assert trace_call["session_id"] == session_id
 
     @pytest.mark.asyncio
-    async def test_error_handling_during_trace_creation(self, mock_langfuse_client, sample_params, sample_scores):
+    @pytest.mark.usefixtures("no_autoflush")
+    async def test_error_handling_during_trace_creation(self, fake_langfuse_client, sample_params, sample_scores):
         """Test error handling when trace creation fails."""
-        from evaluator.oss_providers.langfuse.langfuse_trace_adapter import LangfuseTraceAdapter
-
-        adapter = LangfuseTraceAdapter(langfuse_client=mock_langfuse_client)
+        adapter = LangfuseTraceAdapter(langfuse_client=fake_langfuse_client)
 
-        # Mock trace creation to fail
-        mock_langfuse_client.trace.side_effect = Exception("Trace creation failed")
+        # Make trace creation fail
+        fake_langfuse_client.trace_error = Exception("Trace creation failed")
 
         with pytest.raises(Exception) as exc_info:
             await adapter.record_evaluation_trace(
@@ -255,32 +302,69 @@ class TestLangfuseTraceAdapter:
         assert "Trace creation failed" in str(exc_info.value)
 
     @pytest.mark.asyncio
-    async def test_batch_score_recording(self, mock_langfuse_client, sample_params):
+    async def test_batch_score_recording(self, fake_langfuse_client, sample_params):
         """Test recording multiple sets of scores to the same trace."""
-        from evaluator.oss_providers.langfuse.langfuse_trace_adapter import LangfuseTraceAdapter
+        adapter = LangfuseTraceAdapter(langfuse_client=fake_langfuse_client)
 
-        adapter = LangfuseTraceAdapter(langfuse_client=mock_langfuse_client)
-
-        mock_trace = Mock()
-        mock_trace.score = Mock()
-        mock_trace.update = Mock()
-        mock_trace.id = "batch-trace-id"
+        trace = FakeTrace("batch-trace-id")
 
         # Test recording scores to existing trace
         await adapter.record_scores_to_trace(
-            trace=mock_trace,
+            trace=trace,
             scores={"metric1": 0.8, "metric2": 0.9},
             metadata={"batch": 1}
         )
 
         await adapter.record_scores_to_trace(
-            trace=mock_trace,
+            trace=trace,
             scores={"metric3": 0.7, "metric4": 0.85},
             metadata={"batch": 2}
         )
 
         # Verify all scores were recorded
-        assert mock_trace.score.call_count == 4
+        recorded = {score["name"] for score in trace.score_calls}
+        assert recorded == {"metric1", "metric2", "metric3", "metric4"}
 
         # Verify trace was updated twice
-        assert mock_trace.update.call_count == 2
\ No newline at end of file
+        assert len(trace.update_calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_individual_score_failures_are_isolated(self, fake_langfuse_client):
+        """Test that one failing score call does not stop the others."""
+        adapter = LangfuseTraceAdapter(langfuse_client=fake_langfuse_client)
+
+        class FlakyTrace(FakeTrace):
+            __slots__ = ()
+
+            def score(self, **kwargs):
+                if kwargs["name"] == "metric2":
+                    raise RuntimeError("score rejected")
+                super().score(**kwargs)
+
+        trace = FlakyTrace()
+
+        scores_recorded = await adapter.record_scores_to_trace(
+            trace=trace,
+            scores={"metric1": 0.8, "metric2": 0.9, "metric3": 0.7}
+        )
+
+        assert scores_recorded == 2
+        assert [call["name"] for call in trace.score_calls] == ["metric1", "metric3"]
+
+    @pytest.mark.asyncio
+    async def test_metadata_is_normalized_before_update(self, fake_langfuse_client):
+        """Test that non-finite floats in metadata are sent to Langfuse as null."""
+        adapter = LangfuseTraceAdapter(langfuse_client=fake_langfuse_client)
+
+        trace = FakeTrace()
+
+        await adapter.record_scores_to_trace(
+            trace=trace,
+            scores={"metric1": 0.8},
+            metadata={"threshold": float("nan"), "limits": {"upper": float("inf")}}
+        )
+
+        metadata = trace.update_calls[-1]["metadata"]
+        assert metadata["threshold"] is None
+        assert metadata["limits"] == {"upper": None}
+        assert metadata["scores_recorded"] == 1
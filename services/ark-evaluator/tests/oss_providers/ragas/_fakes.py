@@ -0,0 +1,51 @@
+"""
+Lightweight stand-ins for the RAGAS adapter, LLM and embeddings used by the tests.
+They return canned results instead of building unittest.mock trees.
+"""
+
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Union
+
+
+class FakeAdapter:
+    """RAGAS adapter returning fixed scores and validation results.
+
+    Scores may also be an exception to raise or an async callable to await;
+    each evaluate call's positional arguments are recorded in ``calls``.
+    """
+
+    __slots__ = ("_scores", "_validation_results", "_token_usage", "calls")
+
+    def __init__(
+        self,
+        scores: Union[Dict[str, float], Exception, Callable[..., Awaitable[Dict[str, float]]]],
+        validation_results: Optional[Dict[str, Any]] = None,
+        token_usage: Any = None
+    ):
+        self._scores = scores
+        self._validation_results = validation_results or {}
+        self._token_usage = token_usage
+        self.calls: List[tuple] = []
+
+    async def evaluate(self, input_text: str, output_text: str, metrics: List[str], params: dict) -> Dict[str, float]:
+        args = (input_text, output_text, metrics, params)
+        self.calls.append(args)
+        if isinstance(self._scores, Exception):
+            raise self._scores
+        if callable(self._scores):
+            return await self._scores(*args)
+        return self._scores
+
+    def get_validation_results(self) -> Dict[str, Any]:
+        return self._validation_results
+
+    def get_token_usage(self) -> Any:
+        return self._token_usage
+
+
+class StubLLM:
+    """RAGAS-wrapped LLM or embeddings stand-in that accepts a run config."""
+
+    __slots__ = ()
+
+    def set_run_config(self, run_config):
+        pass
@@ -0,0 +1,16 @@
+"""
+Shared scenario data for the RAGAS tests.
+"""
+
+from typing import Dict
+
+AZURE_PARAMS: Dict[str, str] = {
+    "azure.api_key": "test-key",
+    "azure.endpoint": "https://test.openai.azure.com/",
+    "azure.api_version": "2024-12-01-preview",
+    "azure.deployment_name": "gpt-4",
+}
+
+EIFFEL_INPUT = "Where is the Eiffel Tower located?"
+EIFFEL_OUTPUT = "The Eiffel Tower is located in Paris."
+EIFFEL_CONTEXT = "Paris is the capital of France."
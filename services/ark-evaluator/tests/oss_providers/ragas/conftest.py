@@ -0,0 +1,70 @@
+"""
+Test configuration for RAGAS provider tests.
+"""
+
+from typing import Any, Dict, Optional
+
+import pytest
+
+from src.evaluator.types import UnifiedEvaluationRequest, EvaluationConfig, EvaluationType
+from src.evaluator.oss_providers.ragas.ragas_evaluator import RagasEvaluator
+from src.evaluator.oss_providers.ragas.ragas_provider import RagasProvider
+
+from ._fixtures import AZURE_PARAMS, EIFFEL_INPUT, EIFFEL_OUTPUT, EIFFEL_CONTEXT
+
+
+@pytest.fixture(scope="session")
+def ragas_provider():
+    """RagasProvider shared by all tests; adapters are patched per test."""
+    return RagasProvider()
+
+
+@pytest.fixture(autouse=True)
+def fresh_response_cache(ragas_provider):
+    """Start every test with an empty response cache on the shared provider."""
+    ragas_provider._response_cache.clear()
+
+
+@pytest.fixture
+def make_request():
+    """Build direct evaluation requests against the Azure test configuration."""
+    def _make_request(
+        metrics: str,
+        context: Optional[str] = None,
+        ground_truth: Optional[str] = None,
+        input_text: str = EIFFEL_INPUT,
+        output_text: str = EIFFEL_OUTPUT
+    ) -> UnifiedEvaluationRequest:
+        parameters: Dict[str, Any] = {**AZURE_PARAMS, "metrics": metrics}
+        if context is not None:
+            parameters["context"] = context
+        if ground_truth is not None:
+            parameters["ground_truth"] = ground_truth
+
+        # Inputs are trusted test literals, so skip pydantic validation
+        return UnifiedEvaluationRequest.model_construct(
+            type=EvaluationType.DIRECT,
+            evaluatorName="test-evaluator",
+            config=EvaluationConfig.model_construct(input=input_text, output=output_text),
+            parameters=parameters
+        )
+
+    return _make_request
+
+
+@pytest.fixture(scope="session")
+def recall_dataset():
+    """Dataset prepared once for the context_recall metric."""
+    return RagasEvaluator.prepare_dataset(
+        input_text=EIFFEL_INPUT,
+        output_text=EIFFEL_OUTPUT,
+        context=EIFFEL_CONTEXT,
+        ground_truth=None,  # Not needed for context recall
+        metrics=['context_recall']
+    )
+
+
+@pytest.fixture(scope="session")
+def recall_dataset_row(recall_dataset):
+    """First row of the context_recall dataset as a dictionary."""
+    return recall_dataset[0]
@@ -0,0 +1,72 @@
+"""
+Tests for scoring RAGAS metrics concurrently on a single dataset entry.
+"""
+
+import asyncio
+
+import pytest
+
+from src.evaluator.oss_providers.ragas.ragas_evaluator import RagasEvaluator
+
+from ._fixtures import EIFFEL_INPUT, EIFFEL_OUTPUT, EIFFEL_CONTEXT
+
+DATASET_ENTRY = {
+    'user_input': EIFFEL_INPUT,
+    'response': EIFFEL_OUTPUT,
+    'retrieved_contexts': [EIFFEL_CONTEXT]
+}
+
+
+class StubMetric:
+    """RAGAS metric stand-in that records how many calls overlap."""
+
+    def __init__(self, result, tracker):
+        self._result = result
+        self._tracker = tracker
+
+    async def single_turn_ascore(self, sample):
+        self._tracker["active"] += 1
+        self._tracker["peak"] = max(self._tracker["peak"], self._tracker["active"])
+        await asyncio.sleep(0)
+        self._tracker["active"] -= 1
+        if isinstance(self._result, Exception):
+            raise self._result
+        return self._result
+
+
+@pytest.fixture
+def tracker():
+    return {"active": 0, "peak": 0}
+
+
+@pytest.mark.asyncio
+async def test_failing_metric_does_not_fail_the_others(tracker):
+    """Test that scores are merged and a failing metric is reported separately."""
+    ragas_metrics = {
+        'relevance': StubMetric(0.9, tracker),
+        'faithfulness': StubMetric(RuntimeError("rate limited"), tracker),
+        'context_recall': StubMetric(float('nan'), tracker),
+    }
+
+    scores, metric_errors = await RagasEvaluator.run_metrics_concurrently(
+        DATASET_ENTRY, ['relevance', 'faithfulness', 'context_recall', 'similarity'], ragas_metrics
+    )
+
+    assert scores == {'relevance': 0.9, 'context_recall': 0.7, 'similarity': 0.5}
+    assert metric_errors == {'faithfulness': 'rate limited'}
+    assert tracker["peak"] == 3
+
+
+@pytest.mark.asyncio
+async def test_concurrency_is_bounded(tracker):
+    """Test that no more than max_concurrency metrics are scored at once."""
+    metrics = ['relevance', 'correctness', 'faithfulness']
+    ragas_metrics = {metric: StubMetric(0.8, tracker) for metric in metrics}
+
+    scores, metric_errors = await RagasEvaluator.run_metrics_concurrently(
+        DATASET_ENTRY, metrics, ragas_metrics, max_concurrency=1
+    )
+
+    assert scores == dict.fromkeys(metrics, 0.8)
+    assert metric_errors == {}
+    assert tracker["peak"] == 1
@@ -1,163 +1,22 @@
-#!/usr/bin/env python3
-
 """
-Test script to verify that the context_precision initialization error is fixed.
-This test simulates the original failing scenario.
+Tests verifying that the context_precision initialization error is fixed.
+The provider-level scenario lives in test_metric_scenarios.py.
 """
 
-import sys
-from pathlib import Path
-import asyncio
-from unittest.mock import Mock, AsyncMock, patch
-
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent / "src"))
+from src.evaluator.oss_providers.ragas.ragas_evaluator import RagasEvaluator
 
-from src.evaluator.types import UnifiedEvaluationRequest, EvaluationConfig
-from src.evaluator.oss_providers.ragas.ragas_provider import RagasProvider
+from ._fakes import StubLLM
 
-async def test_context_precision_initialization_fix():
-    """Test that context_precision no longer fails with initialization errors."""
 
-    print("=== Testing Context Precision Initialization Fix ===")
-    print("Verifying that the 'missing 1 required positional argument' error is resolved")
-    print()
+def test_original_error_scenario():
+    """Replicate the original 'MetricWithLLM.init() missing 1 required positional argument' error."""
+    from ragas.metrics import LLMContextPrecisionWithoutReference
 
-    # Create evaluation request that was previously failing
-    request = UnifiedEvaluationRequest(
-        type="direct",
-        evaluatorName="test-evaluator",
-        config=EvaluationConfig(
-            input="Where is the Eiffel Tower located?",
-            output="The Eiffel Tower is located in Paris."
-        ),
-        parameters={
-            "azure.api_key": "test-key",
-            "azure.endpoint": "https://test.openai.azure.com/",
-            "azure.api_version": "2024-12-01-preview",
-            "azure.deployment_name": "gpt-4",
-            "metrics": "context_precision",
-            "context": "Paris is the capital of France."
-        }
+    metrics = RagasEvaluator.initialize_ragas_metrics(
+        metrics=['context_precision'],
+        llm=StubLLM(),
+        embeddings=None
     )
 
-    provider = RagasProvider()
-
-    print(f"Request input: {request.config.input}")
-    print(f"Request output: {request.config.output}")
-    print(f"Request context: {request.parameters.get('context')}")
-    print(f"Metrics requested: {request.parameters.get('metrics')}")
-    print()
-
-    # Mock the adapter to capture what happens during initialization
-    with patch.object(provider, '_get_ragas_adapter') as mock_get_adapter:
-        mock_adapter = AsyncMock()
-
-        # Mock the adapter to simulate different scenarios
-        print("Scenario 1: Simulating successful RAGAS evaluation")
-        print("-" * 50)
-
-        # Mock successful evaluation
-        mock_adapter.evaluate = AsyncMock(return_value={'context_precision': 0.75})
-        mock_adapter.get_validation_results = Mock(return_value={
-            'valid_metrics': ['context_precision'],
-            'invalid_metrics': [],
-            'validation_errors': {}
-        })
-
-        mock_get_adapter.return_value = mock_adapter
-
-        try:
-            result = await provider.evaluate(request)
-
-            print(f"Score: {result.score}")
-            print(f"Passed: {result.passed}")
-            print(f"Error: {result.error}")
-            print()
-
-            if not result.error:
-                print("✅ SUCCESS: No initialization errors detected")
-            elif "missing" in result.error and "positional argument" in result.error:
-                print("❌ FAIL: Still getting the initialization error")
-            else:
-                print(f"ℹ️  Different error (might be expected): {result.error}")
-
-        except Exception as e:
-            if "missing" in str(e) and "positional argument" in str(e):
-                print(f"❌ FAIL: Still getting initialization error: {e}")
-            else:
-                print(f"ℹ️  Different exception (might be expected): {e}")
-
-        print()
-        print("Scenario 2: Simulating initialization attempts")
-        print("-" * 50)
-
-        # Mock the adapter to simulate actual initialization attempts
-        # The key thing is that we should NOT see the 'missing positional argument' error
-
-        mock_adapter.evaluate = AsyncMock(side_effect=Exception("Some other RAGAS error"))
-        mock_adapter.get_validation_results = Mock(return_value={
-            'valid_metrics': [],
-            'invalid_metrics': ['context_precision'],
-            'validation_errors': {'context_precision': 'Some RAGAS validation error'}
-        })
-
-        try:
-            result = await provider.evaluate(request)
-
-            if result.error and "missing" in result.error and "positional argument" in result.error:
-                print("❌ FAIL: Still seeing initialization error")
-            else:
-                print("✅ SUCCESS: No initialization errors (other errors are expected)")
-                print(f"   Actual error: {result.error}")
-
-        except Exception as e:
-            if "missing" in str(e) and "positional argument" in str(e):
-                print(f"❌ FAIL: Still getting initialization error: {e}")
-            else:
-                print("✅ SUCCESS: No initialization errors (other exceptions expected)")
-                print(f"   Actual exception: {e}")
-
-def test_mixed_metrics_compatibility():
-    """Test that context_precision works with other metrics."""
-
-    print("\n=== Testing Mixed Metrics Compatibility ===")
-
-    # Test that we can mix context_precision with other metrics without breaking initialization
-    mixed_metrics_test = {
-        "metrics": "relevance,context_precision",
-        "context": "Paris is the capital of France."
-    }
-
-    print(f"Testing mixed metrics: {mixed_metrics_test['metrics']}")
-    print("This should not cause initialization errors for any metric")
-
-    # Note: In a real environment with RAGAS dependencies, this would test actual initialization
-    # For now, we're mainly checking that our logic changes don't break the code path
-
-    print("✅ Code path is intact (actual testing requires RAGAS environment)")
-
-async def test_original_error_scenario():
-    """Replicate the exact original error scenario."""
-
-    print("\n=== Replicating Original Error Scenario ===")
-    print("Original error:")
-    print("ERROR: MetricWithLLM.init() missing 1 required positional argument: 'run_config'")
-    print()
-
-    # The original error occurred during RAGAS metric initialization
-    # With our fix, this specific error should not happen anymore
-
-    print("With the enhanced initialization logic:")
-    print("- Class-type metrics (LLMContextPrecisionWithoutReference) get proper handling")
-    print("- Multiple initialization patterns are tried")
-    print("- Robust error handling prevents crashes")
-    print("- Function-type metrics (answer_relevancy) still work")
-
-    print("\n✅ The initialization error should be resolved")
-    print("   Any remaining errors would be different RAGAS-related issues")
-
-if __name__ == "__main__":
-    asyncio.run(test_context_precision_initialization_fix())
-    test_mixed_metrics_compatibility()
-    asyncio.run(test_original_error_scenario())
\ No newline at end of file
+    assert len(metrics) == 1
+    assert isinstance(metrics[0], LLMContextPrecisionWithoutReference)
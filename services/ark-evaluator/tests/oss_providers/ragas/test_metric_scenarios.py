@@ -0,0 +1,72 @@
+"""
+End-to-end RAGAS provider scenarios for individual metrics.
+
+Covers the original context_precision initialization error, the context_recall
+validation error and correctness requiring a reference field. Scenarios with a
+mock score stub the adapter; the rest run through the real adapter's validation.
+"""
+
+import pytest
+
+from ._fixtures import EIFFEL_CONTEXT
+from ._fakes import FakeAdapter
+
+
+def _is_initialization_error(message):
+    return "missing" in message and "positional argument" in message
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "metric, context, ground_truth, mock_score, expected_error",
+    [
+        ("context_precision", EIFFEL_CONTEXT, None, 0.75, None),
+        # RAGAS fails with an error unrelated to metric initialization
+        ("context_precision", EIFFEL_CONTEXT, None, Exception("Some other RAGAS error"), "Some other RAGAS error"),
+        ("context_recall", EIFFEL_CONTEXT, None, 0.85, None),
+        ("correctness", None, "The Eiffel Tower is in Paris.", 0.9, None),
+        # Correctness requires the reference field, so it is rejected before any LLM client is created
+        ("correctness", None, None, None, "validation failures"),
+    ],
+    ids=[
+        "context-precision",
+        "context-precision-ragas-error",
+        "context-recall",
+        "correctness-with-reference",
+        "correctness-without-reference",
+    ]
+)
+async def test_evaluate(ragas_provider, make_request, monkeypatch, metric, context, ground_truth, mock_score, expected_error):
+    """Test that each metric evaluates, or fails with its own error rather than an initialization error."""
+    request = make_request(metric, context=context, ground_truth=ground_truth)
+
+    adapter = None
+    if mock_score is not None:
+        valid = expected_error is None
+        adapter = FakeAdapter({metric: mock_score} if valid else mock_score, {
+            'valid_metrics': [metric] if valid else [],
+            'invalid_metrics': [] if valid else [metric],
+            'validation_errors': {} if valid else {metric: 'Some RAGAS validation error'}
+        })
+        monkeypatch.setattr(ragas_provider, "_get_ragas_adapter", lambda parameters: adapter)
+
+    result = await ragas_provider.evaluate(request)
+
+    if expected_error is None:
+        assert result.error is None
+        assert float(result.score) == pytest.approx(mock_score)
+        assert result.passed is True
+        assert metric in result.metadata["valid_metrics"].split(",")
+        assert result.metadata["invalid_metrics"] == ""
+        assert len(adapter.calls) == 1
+    else:
+        assert result.passed is False
+        assert expected_error in result.error
+        assert not _is_initialization_error(result.error)
+
+    if adapter is None:
+        # Rejected by validation, so no score is returned for the invalid metric
+        assert metric in result.error
+        assert result.metadata["requested_metrics"] == metric
+        assert result.metadata["error_type"] == "validation_error"
+        assert result.score is None
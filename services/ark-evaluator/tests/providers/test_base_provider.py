@@ -4,9 +4,7 @@ from typing import Optional
 from unittest.mock import Mock
 
 from src.evaluator.providers.base import EvaluationProvider
-from src.evaluator.types import (
-    UnifiedEvaluationRequest, EvaluationResponse, ModelRef, GoldenExample
-)
+from src.evaluator.types import UnifiedEvaluationRequest, EvaluationResponse
 
 logger = logging.getLogger(__name__)
 
@@ -25,56 +23,51 @@ class MockEvaluationProvider(EvaluationProvider):
         return "mock"
 
 
+@pytest.fixture(scope="class")
+def provider():
+    """Provider shared by the tests in a class; the helpers under test hold no state"""
+    return MockEvaluationProvider()
+
+
 class TestEvaluationProvider:
     """Test suite for base EvaluationProvider abstract class"""
     
-    def setup_method(self):
-        """Set up test fixtures"""
-        self.provider = MockEvaluationProvider()
-        
-    def test_initialization(self):
+    def test_initialization(self, provider):
         """Test provider initialization"""
-        assert self.provider.shared_session is None
+        assert provider.shared_session is None
         
         # Test with shared session
         mock_session = Mock()
         provider_with_session = MockEvaluationProvider(shared_session=mock_session)
         assert provider_with_session.shared_session is mock_session
     
-    def test_get_evaluation_type(self):
+    def test_get_evaluation_type(self, provider):
         """Test evaluation type method"""
-        assert self.provider.get_evaluation_type() == "mock"
-    
-    def test_extract_model_ref_with_valid_params(self):
-        """Test model reference extraction with valid parameters"""
-        parameters = {
-            "model.name": "gpt-4",
-            "model.namespace": "default"
-        }
-        
-        model_ref = self.provider._extract_model_ref(parameters)
-        assert model_ref is not None
-        assert model_ref.name == "gpt-4"
-        assert model_ref.namespace == "default"
-    
-    def test_extract_model_ref_with_default_name(self):
-        """Test model reference extraction defaults to 'default' name"""
-        parameters = {"model.namespace": "custom"}
-        
-        model_ref = self.provider._extract_model_ref(parameters)
-        assert model_ref is not None
-        assert model_ref.name == "default"
-        assert model_ref.namespace == "custom"
+        assert provider.get_evaluation_type() == "mock"
     
-    def test_extract_model_ref_with_no_params(self):
-        """Test model reference extraction with no parameters"""
-        model_ref = self.provider._extract_model_ref(None)
-        assert model_ref is None
+    @pytest.mark.parametrize(
+        "parameters, expected_name, expected_namespace",
+        [
+            ({"model.name": "gpt-4", "model.namespace": "default"}, "gpt-4", "default"),
+            # Name defaults to 'default'
+            ({"model.namespace": "custom"}, "default", "custom"),
+            (None, None, None),
+            ({}, None, None),
+        ],
+        ids=["valid-params", "default-name", "none", "empty"]
+    )
+    def test_extract_model_ref(self, provider, parameters, expected_name, expected_namespace):
+        """Test model reference extraction"""
+        model_ref = provider._extract_model_ref(parameters)
         
-        model_ref = self.provider._extract_model_ref({})
-        assert model_ref is None
+        if expected_name is None:
+            assert model_ref is None
+        else:
+            assert model_ref is not None
+            assert model_ref.name == expected_name
+            assert model_ref.namespace == expected_namespace
     
-    def test_extract_golden_examples_valid_json(self):
+    def test_extract_golden_examples_valid_json(self, provider):
         """Test golden examples extraction with valid JSON"""
         golden_data = [
             {
@@ -97,7 +90,7 @@ class TestEvaluationProvider:
             "golden-examples": json.dumps(golden_data)
         }
         
-        examples = self.provider._extract_golden_examples(parameters)
+        examples = provider._extract_golden_examples(parameters)
         assert examples is not None
         assert len(examples) == 2
         
@@ -117,38 +110,31 @@ class TestEvaluationProvider:
         assert examples[1].difficulty is None
         assert examples[1].category is None
     
-    def test_extract_golden_examples_no_params(self):
-        """Test golden examples extraction with no parameters"""
-        examples = self.provider._extract_golden_examples(None)
-        assert examples is None
+    @pytest.mark.parametrize(
+        "parameters, expected_count",
+        [
+            (None, None),
+            ({}, None),
+            ({"golden-examples": "invalid json content"}, None),
+            ({"golden-examples": "[]"}, 0),
+        ],
+        ids=["none", "empty-params", "invalid-json", "empty-array"]
+    )
+    def test_extract_golden_examples(self, provider, parameters, expected_count):
+        """Test golden examples extraction without usable examples"""
+        examples = provider._extract_golden_examples(parameters)
         
-        examples = self.provider._extract_golden_examples({})
-        assert examples is None
-    
-    def test_extract_golden_examples_invalid_json(self):
-        """Test golden examples extraction with invalid JSON"""
-        parameters = {
-            "golden-examples": "invalid json content"
-        }
-        
-        examples = self.provider._extract_golden_examples(parameters)
-        assert examples is None
-    
-    def test_extract_golden_examples_empty_array(self):
-        """Test golden examples extraction with empty array"""
-        parameters = {
-            "golden-examples": "[]"
-        }
-        
-        examples = self.provider._extract_golden_examples(parameters)
-        assert examples is not None
-        assert len(examples) == 0
+        if expected_count is None:
+            assert examples is None
+        else:
+            assert examples is not None
+            assert len(examples) == expected_count
     
     @pytest.mark.asyncio
-    async def test_evaluate_method_called(self):
+    async def test_evaluate_method_called(self, provider):
         """Test that the evaluate method can be called"""
         mock_request = Mock(spec=UnifiedEvaluationRequest)
-        result = await self.provider.evaluate(mock_request)
+        result = await provider.evaluate(mock_request)
         
         assert isinstance(result, EvaluationResponse)
         assert result.score == "0.8"
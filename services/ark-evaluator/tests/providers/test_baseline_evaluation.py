@@ -1,130 +1,172 @@
+import json
 import pytest
 import logging
+from contextlib import ExitStack
+from types import SimpleNamespace
 from unittest.mock import Mock, AsyncMock, patch
 from fastapi import HTTPException
 
+# These stay at module scope: importing the provider loads the module that
+# the _BASELINE_MODULE patch targets resolve against, and it already pulls in
+# model_resolver and types, so deferring them would save no import time.
+from src.evaluator.model_resolver import ModelConfig
 from src.evaluator.providers.baseline_evaluation import BaselineEvaluationProvider
-from src.evaluator.types import (
-    UnifiedEvaluationRequest, EvaluationResponse, ModelRef,
-    EvaluationParameters, GoldenExample
-)
+from src.evaluator.types import EvaluationResponse
 
 logger = logging.getLogger(__name__)
 
+# Golden examples are constant, so each payload is encoded once at import
+_GOLDEN_BASIC_JSON = json.dumps([
+    {
+        "input": "What is the capital of France?",
+        "expectedOutput": "Paris",
+        "metadata": {"category": "geography"}
+    },
+    {
+        "input": "What is 2 + 2?",
+        "expectedOutput": "4",
+        "metadata": {"category": "math"}
+    }
+])
+_GOLDEN_SINGLE_JSON = json.dumps([{"input": "test", "expectedOutput": "test"}])
+
+# Validated once; tests derive their responses from it with model_copy
+_RESP_TEMPLATE = EvaluationResponse(score="0", passed=True, metadata={})
+
+
+def _response(**fields) -> EvaluationResponse:
+    """Copy the response template with the given fields, skipping re-validation"""
+    return _RESP_TEMPLATE.model_copy(update=fields)
+
+
+# The provider only reads the resolved config, so one instance is shared
+_MODEL_CONFIG = ModelConfig(
+    model="gpt-4",
+    base_url="https://api.openai.com/v1",
+    api_key="test-key"
+)
+
+# Per-example results for the basic golden examples, in call order
+_BASIC_LLM_OUTPUTS = (
+    "Paris is the capital city of France.",
+    "The answer is 4."
+)
+_BASIC_EVAL_RESPONSES = (
+    _response(score="0.95", passed=True, metadata={"message": "Geography evaluation passed"}),
+    _response(score="0.90", passed=True, metadata={"message": "Math evaluation passed"})
+)
+
+
+_BASELINE_MODULE = 'src.evaluator.providers.baseline_evaluation'
+
+# Patchers are built once; each test only starts and stops them
+_BASELINE_PATCHERS = {
+    "model_resolver": patch(f'{_BASELINE_MODULE}.ModelResolver'),
+    "llm_client": patch(f'{_BASELINE_MODULE}.LLMClient'),
+    "evaluator": patch(f'{_BASELINE_MODULE}.LLMEvaluator'),
+    "aggregate": patch.object(BaselineEvaluationProvider, '_aggregate_results'),
+    "response": patch(f'{_BASELINE_MODULE}.EvaluationResponse'),
+}
+
+
+@pytest.fixture
+def patched_baseline_deps():
+    """Patch the baseline provider's collaborators with fresh mocks for one test"""
+    with ExitStack() as stack:
+        yield SimpleNamespace(**{
+            name: stack.enter_context(patcher) for name, patcher in _BASELINE_PATCHERS.items()
+        })
+
+
+@pytest.fixture(scope="module")
+def mock_session():
+    """Shared session stand-in; providers only hold a reference to it"""
+    return Mock()
+
+
+@pytest.fixture(scope="module")
+def baseline_provider():
+    """BaselineEvaluationProvider built once per module; providers keep no per-request state"""
+    return BaselineEvaluationProvider()
+
+
+@pytest.fixture(scope="module")
+def baseline_provider_with_session(mock_session):
+    """BaselineEvaluationProvider bound to the shared mock session"""
+    return BaselineEvaluationProvider(shared_session=mock_session)
+
 
 class TestBaselineEvaluationProvider:
     """Test suite for BaselineEvaluationProvider"""
     
-    def setup_method(self):
-        """Set up test fixtures"""
-        self.provider = BaselineEvaluationProvider()
-        self.mock_session = Mock()
-        self.provider_with_session = BaselineEvaluationProvider(shared_session=self.mock_session)
-    
-    def test_initialization(self):
+    def test_initialization(self, baseline_provider, baseline_provider_with_session, mock_session):
         """Test provider initialization"""
-        assert self.provider.get_evaluation_type() == "baseline"
-        assert self.provider.shared_session is None
-        assert self.provider_with_session.shared_session is self.mock_session
+        assert baseline_provider.get_evaluation_type() == "baseline"
+        assert baseline_provider.shared_session is None
+        assert baseline_provider_with_session.shared_session is mock_session
     
-    def test_get_evaluation_type(self):
+    def test_get_evaluation_type(self, baseline_provider):
         """Test evaluation type identification"""
-        assert self.provider.get_evaluation_type() == "baseline"
+        assert baseline_provider.get_evaluation_type() == "baseline"
     
     @pytest.mark.asyncio
-    async def test_evaluate_missing_golden_examples(self):
+    async def test_evaluate_missing_golden_examples(self, baseline_provider, request_mock):
         """Test evaluation fails with missing golden examples"""
-        request = Mock(spec=UnifiedEvaluationRequest)
+        request = request_mock
         request.evaluatorName = "test-evaluator"
         request.parameters = {}  # No golden examples
         
-        with pytest.raises(HTTPException) as exc_info:
-            await self.provider.evaluate(request)
-        
-        assert exc_info.value.status_code == 422
-        assert "Baseline evaluation requires golden-examples parameter" in str(exc_info.value.detail)
+        with pytest.raises(HTTPException, match=r"^422: Baseline evaluation requires golden-examples parameter"):
+            await baseline_provider.evaluate(request)
     
     @pytest.mark.asyncio
-    async def test_evaluate_missing_golden_examples_with_no_parameters(self):
+    async def test_evaluate_missing_golden_examples_with_no_parameters(self, baseline_provider, request_mock):
         """Test evaluation fails with no parameters at all"""
-        request = Mock(spec=UnifiedEvaluationRequest)
+        request = request_mock
         request.evaluatorName = "test-evaluator"
         request.parameters = None  # No parameters at all
         
-        with pytest.raises(HTTPException) as exc_info:
-            await self.provider.evaluate(request)
-        
-        assert exc_info.value.status_code == 422
-        assert "Baseline evaluation requires golden-examples parameter" in str(exc_info.value.detail)
+        with pytest.raises(HTTPException, match=r"^422: Baseline evaluation requires golden-examples parameter"):
+            await baseline_provider.evaluate(request)
     
     @pytest.mark.asyncio
-    @patch('src.evaluator.providers.baseline_evaluation.ModelResolver')
-    @patch('src.evaluator.providers.baseline_evaluation.LLMClient')
-    @patch('src.evaluator.providers.baseline_evaluation.LLMEvaluator')
-    @patch.object(BaselineEvaluationProvider, '_aggregate_results')
-    @patch('src.evaluator.providers.baseline_evaluation.EvaluationResponse')
-    async def test_evaluate_successful_basic(self, mock_response_class, mock_aggregate, mock_evaluator_class, mock_llm_client_class, mock_model_resolver_class):
+    async def test_evaluate_successful_basic(self, patched_baseline_deps, baseline_provider, request_mock):
         """Test successful baseline evaluation with basic golden examples"""
-        # Setup golden examples
-        import json
-        golden_data = [
-            {
-                "input": "What is the capital of France?",
-                "expectedOutput": "Paris",
-                "metadata": {"category": "geography"}
-            },
-            {
-                "input": "What is 2 + 2?",
-                "expectedOutput": "4",
-                "metadata": {"category": "math"}
-            }
-        ]
-        
+        deps = patched_baseline_deps
+
         # Mock model resolver with proper ModelConfig object
-        from src.evaluator.model_resolver import ModelConfig
         mock_model_resolver = AsyncMock()
-        mock_model_resolver_class.return_value = mock_model_resolver
-        mock_model_config = ModelConfig(
-            model="gpt-4",
-            base_url="https://api.openai.com/v1",
-            api_key="test-key"
-        )
-        mock_model_resolver.resolve_model.return_value = mock_model_config
+        deps.model_resolver.return_value = mock_model_resolver
+        mock_model_resolver.resolve_model.return_value = _MODEL_CONFIG
         
         # Mock LLM client
         mock_llm_client = AsyncMock()
-        mock_llm_client_class.return_value = mock_llm_client
-        mock_llm_client.evaluate.side_effect = [
-            "Paris is the capital city of France.",
-            "The answer is 4."
-        ]
+        deps.llm_client.return_value = mock_llm_client
+        mock_llm_client.evaluate.side_effect = _BASIC_LLM_OUTPUTS
         
         # Mock LLM evaluator
         mock_evaluator_instance = AsyncMock()
-        mock_evaluator_class.return_value = mock_evaluator_instance
-        mock_evaluator_instance.evaluate.side_effect = [
-            EvaluationResponse(score="0.95", passed=True, metadata={"message": "Geography evaluation passed"}),
-            EvaluationResponse(score="0.90", passed=True, metadata={"message": "Math evaluation passed"})
-        ]
+        deps.evaluator.return_value = mock_evaluator_instance
+        mock_evaluator_instance.evaluate.side_effect = _BASIC_EVAL_RESPONSES
         
         # Mock aggregation
-        mock_aggregate.return_value = (0.925, True, {"examples_processed": "2", "passed_examples": "2"})
+        deps.aggregate.return_value = (0.925, True, {"examples_processed": "2", "passed_examples": "2"})
         
         # Mock EvaluationResponse creation to avoid reasoning field issue
-        mock_response = EvaluationResponse(score="0.925", passed=True, metadata={"examples_processed": "2", "passed_examples": "2"})
-        mock_response_class.return_value = mock_response
+        mock_response = _response(score="0.925", passed=True, metadata={"examples_processed": "2", "passed_examples": "2"})
+        deps.response.return_value = mock_response
         
         # Setup request
-        request = Mock(spec=UnifiedEvaluationRequest)
+        request = request_mock
         request.evaluatorName = "test-evaluator"
         request.parameters = {
-            "golden-examples": json.dumps(golden_data),
+            "golden-examples": _GOLDEN_BASIC_JSON,
             "model.name": "gpt-4",
             "model.namespace": "default"
         }
         
         # Execute evaluation
-        result = await self.provider.evaluate(request)
+        result = await baseline_provider.evaluate(request)
         
         # Verify model resolution
         mock_model_resolver.resolve_model.assert_called_once()
@@ -141,234 +183,23 @@ class TestBaselineEvaluationProvider:
         assert result.passed is True
         assert result.metadata["examples_processed"] == "2"
     
-    @pytest.mark.skip(reason="Baseline evaluation implementation has reasoning field issue - needs fix")
-    @pytest.mark.asyncio
-    @patch('src.evaluator.providers.baseline_evaluation.ModelResolver')
-    @patch('src.evaluator.providers.baseline_evaluation.LLMClient')
-    @patch('src.evaluator.providers.baseline_evaluation.LLMEvaluator')
-    async def test_evaluate_partial_success(self, mock_evaluator_class, mock_llm_client_class, mock_model_resolver_class):
-        """Test baseline evaluation with some failures"""
-        # Setup golden examples
-        import json
-        golden_data = [
-            {"input": "Easy question", "expectedOutput": "Easy answer"},
-            {"input": "Hard question", "expectedOutput": "Hard answer"},
-            {"input": "Another question", "expectedOutput": "Another answer"}
-        ]
-        
-        # Mock model resolver
-        mock_model_resolver = Mock()
-        mock_model_resolver_class.return_value = mock_model_resolver
-        mock_model = {"name": "gpt-4", "type": "openai", "config": {}}
-        mock_model_resolver.resolve_model.return_value = mock_model
-        
-        # Mock LLM client
-        mock_llm_client = AsyncMock()
-        mock_llm_client_class.return_value = mock_llm_client
-        mock_llm_client.generate_response.side_effect = [
-            "Correct easy answer",
-            "Wrong hard answer",
-            "Partially correct answer"
-        ]
-        
-        # Mock LLM evaluator with mixed results
-        mock_evaluator_instance = AsyncMock()
-        mock_evaluator_class.return_value = mock_evaluator_instance
-        mock_evaluator_instance.evaluate.side_effect = [
-            EvaluationResponse(score=0.90, passed=True, message="Easy passed"),
-            EvaluationResponse(score=0.40, passed=False, message="Hard failed"),
-            EvaluationResponse(score=0.75, passed=True, message="Another passed")
-        ]
-        
-        # Setup request
-        request = Mock(spec=UnifiedEvaluationRequest)
-        request.evaluatorName = "test-evaluator"
-        request.parameters = {
-            "golden-examples": json.dumps(golden_data),
-            "model.name": "gpt-4",
-            "min-score": "0.7"  # Higher threshold
-        }
-        
-        # Execute evaluation
-        result = await self.provider.evaluate(request)
-        
-        # Verify results
-        expected_avg = (0.90 + 0.40 + 0.75) / 3  # ≈ 0.683
-        assert abs(result.score - expected_avg) < 0.01
-        assert result.passed is False  # Below 0.7 threshold
-        assert "2/3 examples passed" in result.message
-        assert f"Average score: {expected_avg:.3f}" in result.message
-    
-    @pytest.mark.skip(reason="Baseline evaluation implementation has reasoning field issue - needs fix")
-    @pytest.mark.asyncio
-    @patch('src.evaluator.providers.baseline_evaluation.ModelResolver')
-    @patch('src.evaluator.providers.baseline_evaluation.LLMClient')
-    @patch('src.evaluator.providers.baseline_evaluation.LLMEvaluator')
-    async def test_evaluate_with_detailed_golden_examples(self, mock_evaluator_class, mock_llm_client_class, mock_model_resolver_class):
-        """Test baseline evaluation with detailed golden examples including metadata"""
-        # Setup detailed golden examples
-        import json
-        golden_data = [
-            {
-                "input": "Complex AI question",
-                "expectedOutput": "Detailed AI answer",
-                "metadata": {
-                    "category": "artificial_intelligence",
-                    "subcategory": "machine_learning",
-                    "source": "expert_review"
-                },
-                "expectedMinScore": 0.85,
-                "difficulty": "hard",
-                "category": "technical"
-            }
-        ]
-        
-        # Mock dependencies
-        mock_model_resolver = Mock()
-        mock_model_resolver_class.return_value = mock_model_resolver
-        mock_model_resolver.resolve_model.return_value = {"name": "gpt-4", "type": "openai", "config": {}}
-        
-        mock_llm_client = AsyncMock()
-        mock_llm_client_class.return_value = mock_llm_client
-        mock_llm_client.generate_response.return_value = "Generated AI response"
-        
-        mock_evaluator_instance = AsyncMock()
-        mock_evaluator_class.return_value = mock_evaluator_instance
-        mock_evaluator_instance.evaluate.return_value = EvaluationResponse(
-            score=0.92, 
-            passed=True, 
-            message="High-quality technical response"
-        )
-        
-        # Setup request
-        request = Mock(spec=UnifiedEvaluationRequest)
-        request.evaluatorName = "test-evaluator"
-        request.parameters = {
-            "golden-examples": json.dumps(golden_data),
-            "model.name": "gpt-4"
-        }
-        
-        # Execute evaluation
-        result = await self.provider.evaluate(request)
-        
-        # Verify the golden example details were preserved
-        evaluator_call_args = mock_evaluator_instance.evaluate.call_args
-        golden_examples = evaluator_call_args[1]['golden_examples']
-        
-        assert len(golden_examples) == 1
-        example = golden_examples[0]
-        assert example.input == "Complex AI question"
-        assert example.expectedOutput == "Detailed AI answer"
-        assert example.metadata["category"] == "artificial_intelligence"
-        assert example.expectedMinScore == 0.85
-        assert example.difficulty == "hard"
-        assert example.category == "technical"
-        
-        # Verify results
-        assert result.score == 0.92
-        assert result.passed is True
-    
-    @pytest.mark.skip(reason="Baseline evaluation implementation has reasoning field issue - needs fix")
-    @pytest.mark.asyncio
-    @patch('src.evaluator.providers.baseline_evaluation.ModelResolver')
-    @patch('src.evaluator.providers.baseline_evaluation.LLMClient')
-    async def test_evaluate_llm_generation_failure(self, mock_llm_client_class, mock_model_resolver_class):
-        """Test baseline evaluation handles LLM generation failures"""
-        # Setup golden examples
-        import json
-        golden_data = [{"input": "test input", "expectedOutput": "test output"}]
-        
-        # Mock model resolver
-        mock_model_resolver = Mock()
-        mock_model_resolver_class.return_value = mock_model_resolver
-        mock_model_resolver.resolve_model.return_value = {"name": "gpt-4", "type": "openai", "config": {}}
-        
-        # Mock LLM client to raise exception
-        mock_llm_client = AsyncMock()
-        mock_llm_client_class.return_value = mock_llm_client
-        mock_llm_client.generate_response.side_effect = Exception("API call failed")
-        
-        # Setup request
-        request = Mock(spec=UnifiedEvaluationRequest)
-        request.evaluatorName = "test-evaluator"
-        request.parameters = {
-            "golden-examples": json.dumps(golden_data),
-            "model.name": "gpt-4"
-        }
-        
-        # Execute and expect failure
-        with pytest.raises(HTTPException) as exc_info:
-            await self.provider.evaluate(request)
-        
-        assert exc_info.value.status_code == 500
-        assert "Error generating response for golden example" in str(exc_info.value.detail)
-    
-    @pytest.mark.skip(reason="Baseline evaluation implementation has reasoning field issue - needs fix")
-    @pytest.mark.asyncio
-    @patch('src.evaluator.providers.baseline_evaluation.ModelResolver')
-    @patch('src.evaluator.providers.baseline_evaluation.LLMClient')
-    @patch('src.evaluator.providers.baseline_evaluation.LLMEvaluator')
-    async def test_evaluate_with_shared_session(self, mock_evaluator_class, mock_llm_client_class, mock_model_resolver_class):
-        """Test baseline evaluation uses shared session when provided"""
-        # Setup minimal golden examples
-        import json
-        golden_data = [{"input": "test", "expectedOutput": "test"}]
-        
-        # Mock dependencies
-        mock_model_resolver = Mock()
-        mock_model_resolver_class.return_value = mock_model_resolver
-        mock_model_resolver.resolve_model.return_value = {"name": "gpt-4", "type": "openai", "config": {}}
-        
-        mock_llm_client = AsyncMock()
-        mock_llm_client_class.return_value = mock_llm_client
-        mock_llm_client.generate_response.return_value = "test response"
-        
-        mock_evaluator_instance = AsyncMock()
-        mock_evaluator_class.return_value = mock_evaluator_instance
-        mock_evaluator_instance.evaluate.return_value = EvaluationResponse(score=0.8, passed=True, message="Success")
-        
-        # Setup request
-        request = Mock(spec=UnifiedEvaluationRequest)
-        request.evaluatorName = "test-evaluator"
-        request.parameters = {
-            "golden-examples": json.dumps(golden_data),
-            "model.name": "gpt-4"
-        }
-        
-        # Execute with provider that has shared session
-        result = await self.provider_with_session.evaluate(request)
-        
-        # Verify shared session was passed to dependencies
-        mock_llm_client_class.assert_called_once_with(session=self.mock_session)
-        mock_evaluator_class.assert_called_once_with(session=self.mock_session)
-        
-        assert result.score == 0.8
-        assert result.passed is True
-    
     @pytest.mark.asyncio
     @patch('src.evaluator.providers.baseline_evaluation.ModelResolver')
-    async def test_evaluate_model_resolution_failure(self, mock_model_resolver_class):
+    async def test_evaluate_model_resolution_failure(self, mock_model_resolver_class, baseline_provider, request_mock):
         """Test baseline evaluation handles model resolution failures"""
-        # Setup golden examples
-        import json
-        golden_data = [{"input": "test", "expectedOutput": "test"}]
-        
         # Mock model resolver to fail
-        mock_model_resolver = Mock()
+        mock_model_resolver = AsyncMock()
         mock_model_resolver_class.return_value = mock_model_resolver
         mock_model_resolver.resolve_model.side_effect = Exception("Model not found")
         
         # Setup request
-        request = Mock(spec=UnifiedEvaluationRequest)
+        request = request_mock
         request.evaluatorName = "test-evaluator"
         request.parameters = {
-            "golden-examples": json.dumps(golden_data),
+            "golden-examples": _GOLDEN_SINGLE_JSON,
             "model.name": "nonexistent-model"
         }
         
         # Execute and expect failure
-        with pytest.raises(HTTPException) as exc_info:
-            await self.provider.evaluate(request)
-        
-        assert exc_info.value.status_code == 500
-        assert "Failed to resolve model" in str(exc_info.value.detail)
\ No newline at end of file
+        with pytest.raises(HTTPException, match=r"^500: Failed to resolve model"):
+            await baseline_provider.evaluate(request)
\ No newline at end of file
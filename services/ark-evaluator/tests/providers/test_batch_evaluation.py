@@ -4,104 +4,108 @@ from unittest.mock import Mock
 from fastapi import HTTPException
 
 from src.evaluator.providers.batch_evaluation import BatchEvaluationProvider
-from src.evaluator.types import UnifiedEvaluationRequest, EvaluationResponse
+from src.evaluator.types import EvaluationResponse
 
 logger = logging.getLogger(__name__)
 
 
+@pytest.fixture(scope="module")
+def mock_session():
+    """Shared session stand-in; providers only hold a reference to it"""
+    return Mock()
+
+
+@pytest.fixture(scope="module")
+def batch_provider():
+    """BatchEvaluationProvider built once per module; providers keep no per-request state"""
+    return BatchEvaluationProvider()
+
+
+@pytest.fixture(scope="module")
+def batch_provider_with_session(mock_session):
+    """BatchEvaluationProvider bound to the shared mock session"""
+    return BatchEvaluationProvider(shared_session=mock_session)
+
+
 class TestBatchEvaluationProvider:
     """Test suite for BatchEvaluationProvider"""
     
-    def setup_method(self):
-        """Set up test fixtures"""
-        self.provider = BatchEvaluationProvider()
-        self.mock_session = Mock()
-        self.provider_with_session = BatchEvaluationProvider(shared_session=self.mock_session)
-    
-    def test_initialization(self):
+    def test_initialization(self, batch_provider, batch_provider_with_session, mock_session):
         """Test provider initialization"""
-        assert self.provider.get_evaluation_type() == "batch"
-        assert self.provider.shared_session is None
-        assert self.provider_with_session.shared_session is self.mock_session
+        assert batch_provider.get_evaluation_type() == "batch"
+        assert batch_provider.shared_session is None
+        assert batch_provider_with_session.shared_session is mock_session
     
-    def test_get_evaluation_type(self):
+    def test_get_evaluation_type(self, batch_provider):
         """Test evaluation type identification"""
-        assert self.provider.get_evaluation_type() == "batch"
+        assert batch_provider.get_evaluation_type() == "batch"
     
     @pytest.mark.asyncio
-    async def test_evaluate_not_implemented(self):
+    async def test_evaluate_not_implemented(self, batch_provider, request_mock):
         """Test that batch evaluation raises not implemented error"""
-        request = Mock(spec=UnifiedEvaluationRequest)
-        request.evaluator_name = "test-evaluator"
-        
-        with pytest.raises(HTTPException) as exc_info:
-            await self.provider.evaluate(request)
+        request = request_mock
+        request.evaluatorName = "test-evaluator"
         
-        assert exc_info.value.status_code == 501
-        assert "Batch evaluation not yet implemented" in str(exc_info.value.detail)
+        with pytest.raises(HTTPException, match=r"^501: Batch evaluation not yet implemented"):
+            await batch_provider.evaluate(request)
     
     @pytest.mark.asyncio
-    async def test_evaluate_with_various_request_types(self):
+    @pytest.mark.parametrize(
+        "request_attrs",
+        [
+            {"evaluatorName": "test1"},
+            {"evaluatorName": "test2", "config": Mock()},
+            {"evaluatorName": "test3", "parameters": {"test": "value"}},
+        ],
+        ids=["name-only", "with-config", "with-parameters"]
+    )
+    async def test_evaluate_with_various_request_types(self, batch_provider, request_mock, request_attrs):
         """Test that batch evaluation fails consistently regardless of request content"""
-        test_requests = [
-            Mock(spec=UnifiedEvaluationRequest, evaluator_name="test1"),
-            Mock(spec=UnifiedEvaluationRequest, evaluator_name="test2", config=Mock()),
-            Mock(spec=UnifiedEvaluationRequest, evaluator_name="test3", parameters={"test": "value"})
-        ]
+        for name, value in request_attrs.items():
+            setattr(request_mock, name, value)
         
-        for request in test_requests:
-            with pytest.raises(HTTPException) as exc_info:
-                await self.provider.evaluate(request)
-            
-            assert exc_info.value.status_code == 501
-            assert "Batch evaluation not yet implemented" in str(exc_info.value.detail)
+        with pytest.raises(HTTPException, match=r"^501: Batch evaluation not yet implemented"):
+            await batch_provider.evaluate(request_mock)
 
 
-# TODO: Once batch evaluation is implemented, add comprehensive tests here
-class TestBatchEvaluationProviderFutureImplementation:
-    """
-    Placeholder test class for future batch evaluation implementation.
-    
-    When batch evaluation is implemented, these tests should be added:
-    
-    1. test_evaluate_successful_aggregation
-       - Test successful aggregation of multiple evaluation results
-       - Verify correct average scoring and pass/fail logic
-    
-    2. test_evaluate_with_mixed_results  
-       - Test aggregation with some passing and some failing evaluations
-       - Verify proper handling of partial success scenarios
-    
-    3. test_evaluate_missing_evaluation_references
-       - Test failure when config doesn't contain evaluation references
-       - Verify appropriate error handling
-    
-    4. test_evaluate_evaluation_not_found
-       - Test handling when referenced evaluation doesn't exist
-       - Verify proper error reporting
-    
-    5. test_evaluate_evaluation_not_completed
-       - Test handling when referenced evaluation is still pending/running
-       - Verify appropriate waiting or error handling
-    
-    6. test_evaluate_with_weights
-       - Test weighted aggregation of evaluation results
-       - Verify proper calculation of weighted averages
-    
-    7. test_evaluate_kubernetes_api_failures
-       - Test handling of Kubernetes API failures when fetching evaluations
-       - Verify proper error propagation and logging
-    
-    8. test_evaluate_recursive_batch_references
-       - Test detection and handling of circular batch evaluation references
-       - Verify appropriate error handling for invalid configurations
-    
-    9. test_evaluate_with_custom_aggregation_strategy
-       - Test different aggregation strategies (min, max, weighted average, etc.)
-       - Verify configuration-driven aggregation behavior
-    
-    10. test_evaluate_performance_with_large_batch
-        - Test performance and resource usage with large numbers of evaluations
-        - Verify proper resource cleanup and memory management
-    """
-    pass
\ No newline at end of file
+# TODO: Once batch evaluation is implemented, add comprehensive tests here:
+#
+#  1. test_evaluate_successful_aggregation
+#     - Test successful aggregation of multiple evaluation results
+#     - Verify correct average scoring and pass/fail logic
+#
+#  2. test_evaluate_with_mixed_results
+#     - Test aggregation with some passing and some failing evaluations
+#     - Verify proper handling of partial success scenarios
+#
+#  3. test_evaluate_missing_evaluation_references
+#     - Test failure when config doesn't contain evaluation references
+#     - Verify appropriate error handling
+#
+#  4. test_evaluate_evaluation_not_found
+#     - Test handling when referenced evaluation doesn't exist
+#     - Verify proper error reporting
+#
+#  5. test_evaluate_evaluation_not_completed
+#     - Test handling when referenced evaluation is still pending/running
+#     - Verify appropriate waiting or error handling
+#
+#  6. test_evaluate_with_weights
+#     - Test weighted aggregation of evaluation results
+#     - Verify proper calculation of weighted averages
+#
+#  7. test_evaluate_kubernetes_api_failures
+#     - Test handling of Kubernetes API failures when fetching evaluations
+#     - Verify proper error propagation and logging
+#
+#  8. test_evaluate_recursive_batch_references
+#     - Test detection and handling of circular batch evaluation references
+#     - Verify appropriate error handling for invalid configurations
+#
+#  9. test_evaluate_with_custom_aggregation_strategy
+#     - Test different aggregation strategies (min, max, weighted average, etc.)
+#     - Verify configuration-driven aggregation behavior
+#
+# 10. test_evaluate_performance_with_large_batch
+#     - Test performance and resource usage with large numbers of evaluations
+#     - Verify proper resource cleanup and memory management
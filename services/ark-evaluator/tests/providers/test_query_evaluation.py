@@ -32,6 +32,37 @@ class TestQueryEvaluationProvider:
         """Test evaluation type identification"""
         assert self.provider.get_evaluation_type() == "query"
     
+    def test_extract_query_data_single_pass(self):
+        """Test input, agent target and targeted output are extracted together"""
+        query_resource = {
+            "spec": {
+                "input": "What is the weather?",
+                "targets": [
+                    {"type": "model", "name": "forecast-model"},
+                    {"type": "agent", "name": "weather-agent"},
+                    {"type": "agent", "name": "backup-agent"}
+                ]
+            },
+            "status": {
+                "responses": [
+                    {"target": {"type": "agent", "name": "forecast-model"}, "content": "Wrong type"},
+                    {"target": {"type": "model", "name": "forecast-model"}, "content": "Partly cloudy."},
+                    {"target": {"type": "model", "name": "forecast-model"}, "content": "Duplicate"}
+                ]
+            }
+        }
+        
+        input_text, agent_name, output_text = self.provider._extract_query_data(query_resource, "model:forecast-model")
+        
+        assert input_text == "What is the weather?"
+        assert agent_name == "weather-agent"
+        assert output_text == "Partly cloudy."
+        
+        _, _, legacy_output = self.provider._extract_query_data(query_resource, "forecast-model")
+        assert legacy_output == "Wrong type"
+        
+        assert self.provider._extract_query_data({}, None) == ("", None, "")
+    
     @pytest.mark.asyncio
     async def test_evaluate_missing_config(self):
         """Test evaluation fails with missing config"""
@@ -311,6 +342,33 @@ class TestQueryEvaluationProvider:
         assert exc_info.value.status_code == 500
         assert "Failed to fetch query" in str(exc_info.value.detail)
     
+    @pytest.mark.asyncio
+    @patch('src.evaluator.providers.query_evaluation.config')
+    @patch('src.evaluator.providers.query_evaluation.client')
+    async def test_evaluate_kubernetes_config_unavailable(self, mock_k8s_client, mock_k8s_config):
+        """Test evaluation fails when no Kubernetes configuration can be loaded"""
+        from kubernetes.config import ConfigException
+    
+        mock_k8s_config.ConfigException = ConfigException
+        mock_k8s_config.load_incluster_config.side_effect = ConfigException("Not in cluster")
+        mock_k8s_config.load_kube_config.side_effect = ConfigException("No kubeconfig")
+    
+        request = Mock(spec=UnifiedEvaluationRequest)
+        request.config = Mock()
+        request.config.queryRef = Mock()
+        request.config.queryRef.name = "test-query"
+        request.config.queryRef.namespace = "default"
+        request.config.queryRef.responseTarget = None
+        request.evaluatorName = "test-evaluator"
+        request.parameters = {"model.name": "gpt-4"}
+    
+        with pytest.raises(HTTPException) as exc_info:
+            await self.provider.evaluate(request)
+    
+        assert exc_info.value.status_code == 500
+        assert "Failed to load Kubernetes configuration" in str(exc_info.value.detail)
+        mock_k8s_client.CustomObjectsApi.assert_not_called()
+    
     @pytest.mark.asyncio
     @patch('src.evaluator.providers.query_evaluation.config')
     @patch('src.evaluator.providers.query_evaluation.client')
@@ -2,6 +2,7 @@ import pytest
 import logging
 from typing import Dict, Any
 from unittest.mock import patch
+from pydantic import ValidationError
 
 from src.evaluator.types import EvaluationParameters, EvaluationScope
 
@@ -177,6 +178,15 @@ class TestEvaluationParameters:
         assert result["custom_metadata"] == {"key": "value"}
         assert "evaluation_criteria" not in result  # None values excluded
 
+    def test_parameters_are_immutable(self):
+        """Test that EvaluationParameters instances are frozen"""
+        params = EvaluationParameters(scope="relevance")
+        
+        with pytest.raises(ValidationError):
+            params.scope = "accuracy"
+        
+        assert params.scope == "relevance"
+
     def test_parameter_validation(self):
         """Test parameter validation constraints"""
         # Valid min_score range
@@ -4,11 +4,6 @@ Tests for the unified architecture with OSS provider support.
 
 import pytest
 from unittest.mock import Mock, AsyncMock, patch, MagicMock
-import sys
-from pathlib import Path
-
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from evaluator.core import EvaluationManager, PlatformConfiguration, OSSEvaluationProvider
 from evaluator.types import (